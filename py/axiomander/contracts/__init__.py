@@ -19,15 +19,23 @@ Usage:
 from typing import Any, Callable
 
 
+def _contracts_of(func: Callable) -> dict[str, list[Callable]]:
+    """Return the contract lists attached to a function, creating them
+    when the first decorator of a stack is applied."""
+    try:
+        return func._contracts
+    except AttributeError:
+        contracts = func._contracts = {"requires": [], "ensures": [], "invariants": []}
+        return contracts
+
+
 def requires(predicate: Callable[..., bool]) -> Callable:
     """Decorator: attach a precondition to a function.
 
     The predicate receives the same arguments as the function.
     """
     def decorator(func: Callable) -> Callable:
-        if not hasattr(func, "_contracts"):
-            func._contracts = {"requires": [], "ensures": [], "invariants": []}
-        func._contracts["requires"].append(predicate)
+        _contracts_of(func)["requires"].append(predicate)
         return func
     return decorator
 
@@ -38,9 +46,7 @@ def ensures(predicate: Callable[..., bool]) -> Callable:
     The predicate receives args + keyword argument `result`.
     """
     def decorator(func: Callable) -> Callable:
-        if not hasattr(func, "_contracts"):
-            func._contracts = {"requires": [], "ensures": [], "invariants": []}
-        func._contracts["ensures"].append(predicate)
+        _contracts_of(func)["ensures"].append(predicate)
         return func
     return decorator
 
@@ -51,9 +57,7 @@ def invariant(predicate: Callable[..., bool]) -> Callable:
     Used on for/while loops.
     """
     def decorator(func: Callable) -> Callable:
-        if not hasattr(func, "_contracts"):
-            func._contracts = {"requires": [], "ensures": [], "invariants": []}
-        func._contracts["invariants"].append(predicate)
+        _contracts_of(func)["invariants"].append(predicate)
         return func
     return decorator
 
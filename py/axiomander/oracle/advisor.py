@@ -14,6 +14,7 @@ the templated heuristics aren't sufficient.
 from dataclasses import dataclass, field
 from typing import Optional
 
+from .contract_linter import _is_docstring_stmt
 from .docstring_contracts import parse_axiomander_docstring
 
 
@@ -73,6 +74,24 @@ def analyze_function(source: str, func_name: str | None = None) -> FunctionAnaly
     if func_node is None:
         return FunctionAnalysis(name=func_name or "unknown")
 
+    return _analyze_node(func_node, tree, _class_fields_map(tree))
+
+
+def _class_fields_map(tree) -> dict[str, list[str]]:
+    """Annotated fields of every class in the module, keyed by class name."""
+    class_fields_map: dict[str, list[str]] = {}
+    for n in ast.walk(tree):
+        if isinstance(n, ast.ClassDef):
+            fields = []
+            for s in n.body:
+                if isinstance(s, ast.AnnAssign) and isinstance(s.target, ast.Name):
+                    fields.append(s.target.id)
+            if fields:
+                class_fields_map[n.name] = fields
+    return class_fields_map
+
+
+def _analyze_node(func_node, tree, class_fields_map: dict[str, list[str]]) -> FunctionAnalysis:
     analysis = FunctionAnalysis(name=func_node.name)
 
     doc_contracts = parse_axiomander_docstring(func_node)
@@ -109,15 +128,6 @@ def analyze_function(source: str, func_name: str | None = None) -> FunctionAnaly
 
     # Purity analysis
     from .purity_analyzer import analyze_purity as _analyze_purity
-    class_fields_map: dict[str, list[str]] = {}
-    for n in ast.walk(tree):
-        if isinstance(n, ast.ClassDef):
-            fields = []
-            for s in n.body:
-                if isinstance(s, ast.AnnAssign) and isinstance(s.target, ast.Name):
-                    fields.append(s.target.id)
-            if fields:
-                class_fields_map[n.name] = fields
     purity = _analyze_purity(func_node, tree, {}, class_fields_map)
     analysis.has_impure_calls = not purity.is_pure
     analysis.impure_calls = list(dict.fromkeys(purity.impure_calls))
@@ -134,10 +144,12 @@ def analyze_file(source: str) -> FileAnalysis:
     tree = ast.parse(source)
     funcs = []
 
+    # Parse and collect class fields once for the whole file rather than
+    # once per function.
+    class_fields_map = _class_fields_map(tree)
     for node in ast.walk(tree):
         if isinstance(node, ast.FunctionDef):
-            analysis = analyze_function(source, node.name)
-            funcs.append(analysis)
+            funcs.append(_analyze_node(node, tree, class_fields_map))
 
     # Build summary
     total = len(funcs)
@@ -290,9 +302,7 @@ def _classify_in_function(func_node, assert_node) -> str:
             if not seen_code:
                 return "precondition"
             break
-        is_doc = (isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant)
-                  and isinstance(stmt.value.value, str))
-        if not isinstance(stmt, ast.Assert) and not is_doc:
+        if not isinstance(stmt, ast.Assert) and not _is_docstring_stmt(stmt):
             seen_code = True
 
     return "general"
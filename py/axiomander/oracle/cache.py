@@ -339,17 +339,20 @@ class DependencyGraph:
                 name not in result
                 implies(name not in self.nodes, result == [])
         """
-        visited: set[str] = set()
+        # Insertion-ordered dict as the visited set: same membership cost,
+        # but the result lists callers in discovery order rather than
+        # set-iteration order, so it is stable across runs.
+        visited: dict[str, None] = {}
         stack = [name]
         while stack:
             current = stack.pop()
             if current in visited:
                 continue
-            visited.add(current)
+            visited[current] = None
             for caller in self.get_callers(current):
                 if caller not in visited:
                     stack.append(caller)
-        visited.discard(name)
+        visited.pop(name, None)
         result = list(visited)
         return result
 
@@ -389,17 +392,20 @@ class DependencyGraph:
                 name not in result
                 implies(name not in self.nodes, result == [])
         """
-        visited: set[str] = set()
+        # Insertion-ordered dict as the visited set: same membership cost,
+        # but the result lists callers in discovery order rather than
+        # set-iteration order, so it is stable across runs.
+        visited: dict[str, None] = {}
         stack = [name]
         while stack:
             current = stack.pop()
             if current in visited:
                 continue
-            visited.add(current)
+            visited[current] = None
             for caller in self.get_callers(current):
                 if caller not in visited:
                     stack.append(caller)
-        visited.discard(name)
+        visited.pop(name, None)
         result = list(visited)
         return result
 
@@ -428,6 +434,7 @@ class DependencyGraph:
 
 # ─── Cache Store ───────────────────────────────────────────────────
 
+
 class VerificationCache:
     """Content-addressable cache for function verification results.
 
@@ -453,8 +460,6 @@ class VerificationCache:
     def get(self, cache_key: str) -> CacheEntry | None:
         """Look up a cached verification result."""
         path = self._entry_path(cache_key)
-        if not path.exists():
-            return None
         try:
             data = json.loads(path.read_text())
             if data.get("tool_version") != TOOL_VERSION:
@@ -471,6 +476,8 @@ class VerificationCache:
                 timestamp=data.get("timestamp", 0.0),
                 ai_proof=data.get("ai_proof"),
             )
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, KeyError):
             return None
 
@@ -585,9 +592,12 @@ class VerificationCache:
         """
         body_changed: list[str] = []
         contract_changed: list[str] = []
+        # Resolve the project graph once; _eg() walks up the filesystem
+        # looking for the project root on every call.
+        nodes = _eg().nodes
 
         for name, h in current_hashes.items():
-            node = _eg().nodes.get(name)
+            node = nodes.get(name)
             if node is None:
                 # New function — treat as both changed
                 body_changed.append(name)
@@ -626,11 +636,11 @@ class VerificationCache:
         for name in body_changed:
             to_reverify.add(name)
 
-        # Contract-changed functions affect themselves + transitive callers
-        for name in contract_changed:
-            to_reverify.add(name)
-            for caller in get_transitive_callers(name):
-                to_reverify.add(caller)
+        # Contract-changed functions affect themselves + transitive callers.
+        # One traversal from all of them: overlapping caller sets are
+        # walked once and the caller index is built once.
+        to_reverify.update(contract_changed)
+        to_reverify.update(_eg().transitive_callers_of(contract_changed))
 
         result = to_reverify, set(body_changed), set(contract_changed)
         return result
@@ -686,7 +696,6 @@ class VerificationCache:
         callers = get_callers(func_name)
         if callers:
             for c in callers:
-                transitive = get_transitive_callers(func_name)
                 lines.append(f"- `{c}`")
         else:
             lines.append("- (none)")
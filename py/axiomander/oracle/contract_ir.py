@@ -262,8 +262,11 @@ def _extract_int_lit(e: "Expr") -> int | None:
 
 
 def _subst_var(e: "Expr", var: str, val: int) -> "Expr":
-    """Create a copy of e with Var(var) replaced by IntLit(val)."""
-    import copy
+    """Return e with Var(var) replaced by IntLit(val).
+
+    Rebuilt binop/logical spines are fresh nodes; every other subtree is
+    shared with e rather than deep-copied (IR nodes are never mutated).
+    """
     def _subst(node):
         k = getattr(node, 'kind', None)
         if k == 'var' and getattr(node, 'name', None) == var:
@@ -276,7 +279,7 @@ def _subst_var(e: "Expr", var: str, val: int) -> "Expr":
             operands = getattr(node, 'operands', [])
             return Logical(op=getattr(node, 'op', 'and'),
                            operands=[_subst(o) for o in operands])
-        return copy.deepcopy(node)
+        return node
     return _subst(e)
 
 
@@ -71,33 +71,7 @@ def iris_prop(node: Expr, *,
         _LIST_MODEL = list_model
     if post_bound is not None:
         _POST_BOUND = post_bound
-    lm = _LIST_MODEL
-    kind = node.kind
-    dispatch = {
-        "var": _var, "int": _int_lit, "bool": _bool_lit,
-        "binop": _binop, "logical": _logical,
-        "len": lambda n, ps, pv: _list_len(n, ps, pv, lm),
-        "index": _index, "dict_len": _placeholder,
-        "dict_count": _placeholder, "all": _all, "any": _any,
-        "slice_len": _slice_len, "min": _min, "max": _max,
-        "sum": _placeholder, "float": _float, "strlit": _str_lit,
-        "tuple": _placeholder, "dict": _placeholder, "set": _placeholder,
-        "implies": _implies, "raises": _placeholder,
-        "is_shape": _is_shape, "is_valid": _is_valid,
-        "list_eq": _list_eq, "re_match": _re_match,
-        "string_contains": _string_contains,
-        "string_eq": _string_eq,
-        "hex_string": _hex_string,
-        "recursor": _recursor, "rown": _placeholder,
-        "opaque_term": _placeholder,
-        "field_access": _field_access,
-    }
-    # The "len" dispatch captures lm via closure.  For "binop" and
-    # "logical" which recurse into iris_prop, the inner call does NOT
-    # pass list_model, but that's fine: "len" nodes appear as direct
-    # operands of binops, and the dispatch at the top of iris_prop
-    # handles them before the binop's recursion reaches them.
-    return dispatch[kind](node, param_set, post_var)
+    return _IRIS_PROP_DISPATCH[node.kind](node, param_set, post_var)
 
 
 _STRING_PARAMS: set[str] = set()
@@ -423,6 +397,37 @@ def _field_access(n, ps, pv):
     return f'model_field_Z {obj} "{n.field}"'
 
 
+def _len(n, ps, pv):
+    # "len" nodes read the list model set by the outermost iris_prop call.
+    # For "binop" and "logical", which recurse into iris_prop, the inner
+    # call does NOT pass list_model, but that's fine: the module-level
+    # model is still the one the outer call installed.
+    return _list_len(n, ps, pv, _LIST_MODEL)
+
+
+# Node kind -> handler.  Built once rather than on every (recursive)
+# iris_prop call.
+_IRIS_PROP_DISPATCH = {
+    "var": _var, "int": _int_lit, "bool": _bool_lit,
+    "binop": _binop, "logical": _logical,
+    "len": _len,
+    "index": _index, "dict_len": _placeholder,
+    "dict_count": _placeholder, "all": _all, "any": _any,
+    "slice_len": _slice_len, "min": _min, "max": _max,
+    "sum": _placeholder, "float": _float, "strlit": _str_lit,
+    "tuple": _placeholder, "dict": _placeholder, "set": _placeholder,
+    "implies": _implies, "raises": _placeholder,
+    "is_shape": _is_shape, "is_valid": _is_valid,
+    "list_eq": _list_eq, "re_match": _re_match,
+    "string_contains": _string_contains,
+    "string_eq": _string_eq,
+    "hex_string": _hex_string,
+    "recursor": _recursor, "rown": _placeholder,
+    "opaque_term": _placeholder,
+    "field_access": _field_access,
+}
+
+
 # -- Convenience: compile contracts from the linter ---------------------------
 
 def _result_value_kind(node: Expr, ret_var: str) -> str:
@@ -7,6 +7,8 @@ both Coq Prop strings and SMT-LIB formulas.
 """
 
 import ast
+import copy
+import operator
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
@@ -18,7 +20,7 @@ from .contract_ir import (
     LenExpr, IndexExpr, DictLenExpr, DictCountExpr,
     AllExpr, AnyExpr, SliceLenExpr,
     MinExpr, MaxExpr, SumExpr, StrLitExpr, FloatExpr, TupleExpr, DictExpr, SetExpr,
-    ImpliesExpr, RaisesExpr, IsShape, IsValid, ListEqExpr,
+    ImpliesExpr, RaisesExpr, IsShape, IsValid, ListEqExpr, StringEqualsExpr,
 )
 
 
@@ -77,6 +79,92 @@ class LintResult:
 
 # ─── Linter (IR-emitting visitor) ─────────────────────────────────
 
+# Exact literal type -> IR literal node.  ast.Constant only holds builtin
+# values, so dispatching on type() keeps bool apart from int without
+# relying on isinstance ordering.
+_CONSTANT_LITERALS = {bool: BoolLit, int: IntLit, str: StrLitExpr}
+
+# ast operator class -> contract IR operator, built once at import.
+_BINOP_OPS = {
+    ast.Add: "+", ast.Sub: "-", ast.Mult: "*",
+    ast.Div: "/", ast.FloorDiv: "/", ast.Mod: "mod",
+}
+_COMPARE_OPS = {
+    ast.Eq: "=", ast.NotEq: "<>", ast.Lt: "<", ast.LtE: "<=",
+    ast.Gt: ">", ast.GtE: ">=", ast.Is: "=", ast.IsNot: "<>",
+    ast.In: "in", ast.NotIn: "notin",
+}
+
+# Integer ops folded at lint time when both operands are literals.  These
+# agree between Python, Coq Z and SMT Int; division and mod do not (for
+# negative operands), so they are always emitted symbolically.
+_INT_FOLD = {"+": operator.add, "-": operator.sub, "*": operator.mul}
+
+
+def _collect_boolop(node: ast.expr, op_cls: type, out: list[ast.expr]) -> None:
+    """Append the operands of nested ``op_cls`` BoolOps under ``node``."""
+    if isinstance(node, ast.BoolOp) and type(node.op) is op_cls:
+        for v in node.values:
+            _collect_boolop(v, op_cls, out)
+    else:
+        out.append(node)
+
+
+def _names_in(node: ast.AST, cache: dict[int, frozenset[str]]) -> frozenset[str]:
+    """Every Name id under node, memoized per subtree by id in cache."""
+    key = id(node)
+    names = cache.get(key)
+    if names is None:
+        if isinstance(node, ast.Name):
+            names = frozenset((node.id,))
+        else:
+            names = frozenset().union(
+                *(_names_in(c, cache) for c in ast.iter_child_nodes(node)))
+        cache[key] = names
+    return names
+
+
+def _subst_names(node: ast.AST, mapping: dict[str, ast.expr],
+                 memo: dict[int, ast.AST],
+                 names: dict[int, frozenset[str]] | None = None) -> ast.AST:
+    """Return node with Names in mapping replaced by their argument nodes.
+
+    The input tree is left untouched: only the path from each replaced
+    Name up to the root is rebuilt (shallow copies) and every unchanged
+    subtree is shared.  memo maps id(node) -> result for one mapping, so
+    a subtree reached twice under that mapping is rewritten once.  With
+    names (filled by _names_in for this tree), subtrees mentioning none
+    of the mapped names are returned without being walked.
+    """
+    key = id(node)
+    hit = memo.get(key)
+    if hit is not None:
+        return hit
+    if names is not None and mapping.keys().isdisjoint(names[key]):
+        return node
+    if isinstance(node, ast.Name):
+        out = mapping.get(node.id, node)
+    else:
+        changes: dict[str, object] = {}
+        for name, value in ast.iter_fields(node):
+            if isinstance(value, ast.AST):
+                new = _subst_names(value, mapping, memo, names)
+                if new is not value:
+                    changes[name] = new
+            elif isinstance(value, list):
+                new_list = [_subst_names(v, mapping, memo, names)
+                            if isinstance(v, ast.AST) else v for v in value]
+                if any(a is not b for a, b in zip(new_list, value)):
+                    changes[name] = new_list
+        out = node
+        if changes:
+            out = copy.copy(node)
+            for name, value in changes.items():
+                setattr(out, name, value)
+    memo[key] = out
+    return out
+
+
 class ContractLinter(ast.NodeVisitor):
     """Validates assert expressions and compiles to IR.
 
@@ -97,14 +185,25 @@ class ContractLinter(ast.NodeVisitor):
         self.ghost_resolver: dict[str, str] = ghost_resolver or {}
         self.param_type_hint: dict[str, str] = param_type_hint or {}
         self.predicate_defs: dict[str, object] = {}  # name -> PredicateDef
+        self._self_recursive: dict[str, bool] = {}  # predicate name -> has self-calls
+        # id(subtree) -> Name ids under it, for predicate bodies and their
+        # post asserts; those trees live as long as self.predicates.
+        self._pred_names: dict[int, frozenset[str]] = {}
 
-    def lint_expression(self, node: ast.expr) -> LintResult:
-        """Convert a Python expression to IR. Returns LintResult with coq/smt."""
+    def lint_expression(self, node: ast.expr, translate: bool = True) -> LintResult:
+        """Convert a Python expression to IR. Returns LintResult with coq/smt.
+
+        With translate=False the Coq/SMT strings are left empty; callers
+        that only consume ``ir`` or the violations skip rendering them.
+        """
         assert isinstance(node, ast.expr)
         self.violations = []
         ir = self.visit(node)
-        coq = ir.to_coq(scoped=(self.context != "precondition"), unbound=self.unbound) if ir else ""
-        smt = ir.to_smt() if ir else ""
+        if ir is None or not translate:
+            coq = smt = ""
+        else:
+            coq = ir.to_coq(scoped=(self.context != "precondition"), unbound=self.unbound)
+            smt = ir.to_smt()
         return LintResult(
             expr_node=node,
             violations=list(self.violations),
@@ -186,15 +285,16 @@ class ContractLinter(ast.NodeVisitor):
                         return StringEqualsExpr(var=right.name, literal=left.value, negated=(op == "!="))
                 return BinOp(op=op, left=left, right=right)
             return None
-        # Chained: a < b < c → (a < b) /\ (b < c)
-        parts = [node.left] + node.comparators
+        # Chained: a < b < c → (a < b) /\ (b < c).  Each operand is
+        # visited once; a middle operand is shared by both comparisons.
         conjuncts = []
-        for i, op in enumerate(node.ops):
-            left = self.visit(parts[i])
-            right = self.visit(parts[i + 1])
+        left = self.visit(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = self.visit(comparator)
             op_str = self._translate_compare_op(op)
             if left and right:
                 conjuncts.append(BinOp(op=op_str, left=left, right=right))
+            left = right
         return Logical(op="and", operands=conjuncts) if conjuncts else None
 
     def _expand_set_membership(self, left_node: ast.expr, set_node: ast.Set,
@@ -208,24 +308,24 @@ class ContractLinter(ast.NodeVisitor):
         BinOp.  The left operand may be a Name or an attribute chain
         (e.g. result.status), resolved through the normal visitor.
         """
-        from .contract_ir import StringEqualsExpr
         left = self.visit(left_node)
         if left is None or not isinstance(left, Var):
             return None
+        cmp_op = "<>" if negated else "="
         terms: list[Expr] = []
         for elt in set_node.elts:
-            if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+            if not isinstance(elt, ast.Constant):
+                # Unsupported element kind: bail to the generic path.
+                return None
+            value = elt.value
+            if isinstance(value, str):
                 terms.append(StringEqualsExpr(
-                    var=left.name, literal=elt.value, negated=negated))
-            elif isinstance(elt, ast.Constant) and isinstance(elt.value, bool):
-                iv = 1 if elt.value else 0
-                terms.append(BinOp(op=("<>" if negated else "="),
-                                   left=left, right=IntLit(value=iv)))
-            elif isinstance(elt, ast.Constant) and isinstance(elt.value, int):
-                terms.append(BinOp(op=("<>" if negated else "="),
-                                   left=left, right=IntLit(value=elt.value)))
+                    var=left.name, literal=value, negated=negated))
+            elif isinstance(value, int):
+                # bool is an int subclass: True/False become 1/0.
+                terms.append(BinOp(op=cmp_op, left=left,
+                                   right=IntLit(value=int(value))))
             else:
-                # Unsupported element kind: bail to the generic path.
                 return None
         if not terms:
             return None
@@ -234,7 +334,11 @@ class ContractLinter(ast.NodeVisitor):
         return Logical(op=("and" if negated else "or"), operands=terms)
 
     def visit_BoolOp(self, node: ast.BoolOp) -> Optional[Expr]:
-        operands = [self.visit(v) for v in node.values]
+        # Parenthesised same-op groups, a and (b and c), become one flat
+        # Logical rather than a Logical nested per level.
+        values: list[ast.expr] = []
+        _collect_boolop(node, type(node.op), values)
+        operands = [self.visit(v) for v in values]
         operands = [o for o in operands if o]
         if not operands:
             return None
@@ -254,16 +358,20 @@ class ContractLinter(ast.NodeVisitor):
         return None
 
     def visit_BinOp(self, node: ast.BinOp) -> Optional[Expr]:
-        op_map = {
-            ast.Add: "+", ast.Sub: "-", ast.Mult: "*",
-            ast.Div: "/", ast.FloorDiv: "/", ast.Mod: "mod",
-        }
-        op = op_map.get(type(node.op))
+        op = _BINOP_OPS.get(type(node.op))
         if not op:
             return None
         left = self.visit(node.left)
         right = self.visit(node.right)
-        return BinOp(op=op, left=left, right=right) if left and right else None
+        if not (left and right):
+            return None
+        fold = _INT_FOLD.get(op)
+        if fold and type(left) is IntLit and type(right) is IntLit:
+            value = fold(left.value, right.value)
+            # Negative literals keep the (-1 * n) form the emitters expect.
+            if value >= 0:
+                return IntLit(value=value)
+        return BinOp(op=op, left=left, right=right)
 
     def visit_Call(self, node: ast.Call) -> Optional[Expr]:
         name = self._get_call_name(node)
@@ -404,41 +512,29 @@ class ContractLinter(ast.NodeVisitor):
         if body_expr is not None:
             # Check if the predicate body is recursive (contains self-calls).
             # If so, emit a PredicateCallExpr instead of inlining.
-            from .predicate_def import _find_self_calls
-            if _find_self_calls(body_expr, name):
+            recursive = self._self_recursive.get(name)
+            if recursive is None:
+                from .predicate_def import _find_self_calls
+                recursive = self._self_recursive[name] = bool(
+                    _find_self_calls(body_expr, name))
+            if recursive:
                 from .contract_ir import PredicateCallExpr
                 ir_args = [self.visit(a) for a in node.args]
                 ir_args = [a for a in ir_args if a is not None]
                 return PredicateCallExpr(name=name, args=ir_args)
-            class _Subst(ast_module.NodeTransformer):
-                def __init__(self, mapping):
-                    self.mapping = mapping
-                def visit_Name(self, n):
-                    if n.id in self.mapping:
-                        return self.mapping[n.id]
-                    return n
             mapping = {p: a for p, a in zip(param_names, node.args)}
-            expanded = _Subst(mapping).visit(ast_module.fix_missing_locations(
-                ast_module.Module(body=[ast_module.Expr(value=body_expr)], type_ignores=[])
-            ))
-            inner_expr = expanded.body[0].value
-            return self.visit(inner_expr)
+            _names_in(body_expr, self._pred_names)
+            return self.visit(_subst_names(body_expr, mapping, {},
+                                           self._pred_names))
         if post_asserts:
-            class _Subst(ast_module.NodeTransformer):
-                def __init__(self, mapping):
-                    self.mapping = mapping
-                def visit_Name(self, n):
-                    if n.id in self.mapping:
-                        return self.mapping[n.id]
-                    return n
             mapping = {p: a for p, a in zip(param_names, node.args)}
             mapping['result'] = ast_module.Constant(value=1)
             conjuncts = []
+            memo: dict[int, ast.AST] = {}
             for post in post_asserts:
-                substituted = _Subst(mapping).visit(ast_module.fix_missing_locations(
-                    ast_module.Module(body=[ast_module.Expr(value=post.test)], type_ignores=[])
-                ))
-                inner_ir = self.visit(substituted.body[0].value)
+                _names_in(post.test, self._pred_names)
+                inner_ir = self.visit(_subst_names(post.test, mapping, memo,
+                                                   self._pred_names))
                 if inner_ir:
                     conjuncts.append(inner_ir)
             if len(conjuncts) == 1:
@@ -453,12 +549,9 @@ class ContractLinter(ast.NodeVisitor):
         return None
 
     def visit_Constant(self, node: ast.Constant) -> Expr:
-        if isinstance(node.value, bool):
-            return BoolLit(value=node.value)
-        if isinstance(node.value, int):
-            return IntLit(value=node.value)
-        if isinstance(node.value, str):
-            return StrLitExpr(value=node.value)
+        lit = _CONSTANT_LITERALS.get(type(node.value))
+        if lit is not None:
+            return lit(value=node.value)
         if isinstance(node.value, float):
             # Float literals → FloatExpr (Z-encoded, scaled * 100)
             return FloatExpr(value=int(node.value * 100))
@@ -592,12 +685,7 @@ class ContractLinter(ast.NodeVisitor):
         return ".".join(reversed(parts))
 
     def _translate_compare_op(self, op: ast.cmpop) -> str:
-        op_map = {
-            ast.Eq: "=", ast.NotEq: "<>", ast.Lt: "<", ast.LtE: "<=",
-            ast.Gt: ">", ast.GtE: ">=", ast.Is: "=", ast.IsNot: "<>",
-            ast.In: "in", ast.NotIn: "notin",
-        }
-        return op_map.get(type(op), "=")
+        return _COMPARE_OPS.get(type(op), "=")
 
     def _translate_pure_call(self, node: ast.Call, name: str) -> Optional[Expr]:
         if name == "len":
@@ -625,6 +713,11 @@ class ContractLinter(ast.NodeVisitor):
         if name in ("abs", "min", "max"):
             args = [self.visit(a) for a in node.args]
             args = [a for a in args if a]
+            if (len(args) >= 2 and name != "abs"
+                    and type(args[0]) is IntLit and type(args[1]) is IntLit):
+                # min/max of two literals folds to the literal.
+                pick = min if name == "min" else max
+                return IntLit(value=pick(args[0].value, args[1].value))
             if len(args) >= 2 and name == "min":
                 return MinExpr(left=args[0], right=args[1])
             if len(args) >= 2 and name == "max":
@@ -687,9 +780,8 @@ class ContractLinter(ast.NodeVisitor):
         # Compiles to True in Coq Prop; the real guarantee is discharged
         # transitively through the callee's own contract.
         from .contract_ir import OpaqueTerm
-        return OpaqueTerm(name=name, args=[
-            self.visit(a) for a in node.args if self.visit(a) is not None
-        ])
+        args = [self.visit(a) for a in node.args]
+        return OpaqueTerm(name=name, args=[a for a in args if a is not None])
 
     def _compile_comprehension_filter(self, var_name: str,
                                        ifs: list[ast.expr]) -> str | None:
@@ -804,6 +896,16 @@ class AssertInfo:
     lint_result: LintResult
 
 
+def _is_docstring_stmt(s: ast.stmt) -> bool:
+    """True for a bare string-literal statement (docstring or string comment).
+
+    Exact type checks: ast nodes are never subclassed, so this skips the
+    subclass walk isinstance would do on every body statement.
+    """
+    return (type(s) is ast.Expr and type(s.value) is ast.Constant
+            and type(s.value.value) is str)
+
+
 def lint_file(source: str | Path) -> list[AssertInfo]:
     if isinstance(source, Path):
         source = source.read_text()
@@ -811,10 +913,6 @@ def lint_file(source: str | Path) -> list[AssertInfo]:
     linter = ContractLinter()
     results: list[AssertInfo] = []
 
-    def is_docstring(s):
-        return (isinstance(s, ast.Expr) and isinstance(s.value, ast.Constant)
-                and isinstance(s.value.value, str))
-
     def walk_body(body: list[ast.stmt], ctx: str, parent_node=None):
         seen_code = False
         for i, stmt in enumerate(body):
@@ -833,7 +931,7 @@ def lint_file(source: str | Path) -> list[AssertInfo]:
                     node=stmt, lineno=stmt.lineno, col_offset=stmt.col_offset,
                     classification=classification, lint_result=lint_result,
                 ))
-            elif is_docstring(stmt) or isinstance(stmt, ast.Return):
+            elif _is_docstring_stmt(stmt) or isinstance(stmt, ast.Return):
                 continue
             else:
                 seen_code = True
@@ -17,6 +17,8 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from .shape_ir import lookup_shape
+
 
 # ---------------------------------------------------------------------------
 # Core logical builtins
@@ -52,7 +54,6 @@ def is_shape(obj: Any, model_type: str) -> bool:
     This is the runtime counterpart of ``IsShape.to_coq()``.
     """
     try:
-        from .shape_ir import lookup_shape
         shape = lookup_shape(model_type)
         if shape is None:
             return True  # unknown type -- conservative pass
@@ -64,6 +65,41 @@ def is_shape(obj: Any, model_type: str) -> bool:
         return True
 
 
+# Field-constraint template forms (from _extract_field_constraints), each
+# paired with the check it denotes on the field value ``v`` and bound ``n``:
+#   ge:  "(N <= asZ ({key_scoped}))"
+#   gt:  "(N < asZ ({key_scoped}))"
+#   le:  "(asZ ({key_scoped}) <= N)"
+#   lt:  "(asZ ({key_scoped}) < N)"
+_BOUND_FORMS = (
+    (re.compile(r'^\((-?\d+) <= asZ'), lambda v, n: v >= n),
+    (re.compile(r'^\((-?\d+) < asZ'), lambda v, n: v > n),
+    (re.compile(r'^\(asZ \([^)]+\) <= (-?\d+)\)'), lambda v, n: v <= n),
+    (re.compile(r'^\(asZ \([^)]+\) < (-?\d+)\)'), lambda v, n: v < n),
+)
+
+# Template -> (check, bound), or None for a template that is not a numeric
+# bound.  Templates come from a small fixed set per shape, while is_valid
+# runs once per generated example, so each is parsed only once.
+_BOUND_CACHE: dict[str, Any] = {}
+
+
+def _parse_bound(tmpl: str) -> Any:
+    """Return the (check, bound) pair for a constraint template, or None."""
+    try:
+        return _BOUND_CACHE[tmpl]
+    except KeyError:
+        pass
+    parsed = None
+    for pattern, check in _BOUND_FORMS:
+        m = pattern.match(tmpl)
+        if m:
+            parsed = (check, int(m.group(1)))
+            break
+    _BOUND_CACHE[tmpl] = parsed
+    return parsed
+
+
 def is_valid(obj: Any, model_type: str) -> bool:
     """Check that obj satisfies all declared Field constraints for model_type.
 
@@ -74,9 +110,7 @@ def is_valid(obj: Any, model_type: str) -> bool:
 
     This is the runtime counterpart of ``IsValid.to_coq()``.
     """
-    import re as _re
     try:
-        from .shape_ir import lookup_shape
         shape = lookup_shape(model_type)
         if shape is None:
             return True
@@ -85,22 +119,8 @@ def is_valid(obj: Any, model_type: str) -> bool:
                 return False
             val = getattr(obj, f.name)
             for tmpl in (f.constraints or []):
-                # Template forms (from _extract_field_constraints):
-                #   ge:  "(N <= asZ ({key_scoped}))"
-                #   gt:  "(N < asZ ({key_scoped}))"
-                #   le:  "(asZ ({key_scoped}) <= N)"
-                #   lt:  "(asZ ({key_scoped}) < N)"
-                m_ge = _re.match(r'^\((-?\d+) <= asZ', tmpl)
-                m_gt = _re.match(r'^\((-?\d+) < asZ', tmpl)
-                m_le = _re.match(r'^\(asZ \([^)]+\) <= (-?\d+)\)', tmpl)
-                m_lt = _re.match(r'^\(asZ \([^)]+\) < (-?\d+)\)', tmpl)
-                if m_ge and not (val >= int(m_ge.group(1))):
-                    return False
-                if m_gt and not (val > int(m_gt.group(1))):
-                    return False
-                if m_le and not (val <= int(m_le.group(1))):
-                    return False
-                if m_lt and not (val < int(m_lt.group(1))):
+                bound = _parse_bound(tmpl)
+                if bound is not None and not bound[0](val, bound[1]):
                     return False
         return True
     except Exception:
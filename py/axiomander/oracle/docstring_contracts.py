@@ -13,6 +13,16 @@ import re
 from dataclasses import dataclass, field
 
 
+# Section header on its own line, e.g. ``ensures:``.
+_SECTION_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*):\s*$")
+# Per-line keyword form, e.g. ``requires x > 0`` / ``ensures: result >= 0``.
+_KEYWORD_RE = re.compile(
+    r"^(requires|ensures|owns|preserves)(?:\s+|\s*:\s*)(.+?)$")
+# Cheap prefix gate for _KEYWORD_RE: most lines are expression bodies and
+# never start with a keyword, so they skip the regex entirely.
+_KEYWORD_PREFIXES = ("requires", "ensures", "owns", "preserves")
+
+
 @dataclass
 class DocstringContracts:
     where: dict[str, str] = field(default_factory=dict)
@@ -96,14 +106,14 @@ def parse_axiomander_docstring(func_node: ast.FunctionDef) -> DocstringContracts
             continue
 
         # ── Section-header style: word: on its own line ──
-        m_section = re.match(r"^([A-Za-z_][A-Za-z0-9_]*):\s*$", stripped)
+        m_section = _SECTION_RE.match(stripped) if stripped.endswith(":") else None
         if m_section and not cont_ensures:
             section = m_section.group(1)
             continue
 
         # ── Per-line-keyword style: <keyword> <expr> ──
-        m_kw = re.match(
-            r"^(requires|ensures|owns|preserves)(?:\s+|\s*:\s*)(.+?)$", stripped)
+        m_kw = (_KEYWORD_RE.match(stripped)
+                if stripped.startswith(_KEYWORD_PREFIXES) else None)
         if m_kw:
             kw = m_kw.group(1)
             rest = m_kw.group(2).strip()
@@ -284,39 +294,42 @@ def docstring_assert_nodes(func_node: ast.FunctionDef) -> list[tuple[ast.Assert,
     parsed = parse_axiomander_docstring(func_node)
     out: list[tuple[ast.Assert, str]] = []
 
-    def _group_expressions(entries: list[str]) -> list[str]:
+    def _group_expressions(
+        entries: list[str],
+    ) -> list[tuple[str, ast.expr | None]]:
         """Join continuation lines into complete expressions.
 
         Each line that parses as a standalone eval expression starts a new
         group.  Each line that does NOT parse is joined (with a space) to
         the most recent incomplete group — or starts a new one if there
-        is no incomplete group already open.
+        is no incomplete group already open.  Groups that parsed here
+        carry their expression so it is not parsed again.
         """
-        groups: list[str] = []
+        groups: list[tuple[str, ast.expr | None]] = []
         incomplete = False
         for text in entries:
             try:
-                ast.parse(text, mode="eval")
-                groups.append(text)
+                groups.append((text, ast.parse(text, mode="eval").body))
                 incomplete = False
             except SyntaxError:
                 if incomplete and groups:
-                    groups[-1] = groups[-1] + " " + text
+                    groups[-1] = (groups[-1][0] + " " + text, None)
                 else:
-                    groups.append(text)
+                    groups.append((text, None))
                     incomplete = True
         return groups
 
     # requires -> precondition, ensures -> postcondition
-    for expr_text, cls in [
-        (e, "precondition") for e in _group_expressions(parsed.requires)
+    for (expr_text, expr), cls in [
+        (g, "precondition") for g in _group_expressions(parsed.requires)
     ] + [
-        (e, "postcondition") for e in _group_expressions(parsed.ensures)
+        (g, "postcondition") for g in _group_expressions(parsed.ensures)
     ]:
-        try:
-            expr = ast.parse(expr_text, mode="eval").body
-        except SyntaxError:
-            continue
+        if expr is None:
+            try:
+                expr = ast.parse(expr_text, mode="eval").body
+            except SyntaxError:
+                continue
         node = ast.Assert(test=expr, msg=None)
         node.lineno = getattr(func_node, "lineno", 1)
         node.col_offset = 0
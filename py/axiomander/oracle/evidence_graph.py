@@ -28,7 +28,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Optional
-import json, os, hashlib
+import json, os, hashlib, sys
 
 
 # ── Proof status (roadmap model) ──────────────────────────────────
@@ -46,24 +46,31 @@ class ProofStatus(Enum):
 
     @property
     def is_proved(self) -> bool:
-        return self in (
-            ProofStatus.PROVED_L1_LTAC,
-            ProofStatus.PROVED_L2_SMT,
-            ProofStatus.PROVED_L2B_THEORY,
-            ProofStatus.PROVED_L3_ORACLE,
-        )
+        return self in _PROVED_STATUSES
 
     @property
     def is_assumed(self) -> bool:
-        return self in (
-            ProofStatus.ASSUMED_STUB,
-            ProofStatus.USER_AXIOM,
-        )
+        return self in _ASSUMED_STATUSES
 
     @property
     def is_terminal(self) -> bool:
         """Terminal statuses — no further verification expected."""
-        return self.is_proved or self == ProofStatus.COUNTEREXAMPLE_FOUND
+        return self in _TERMINAL_STATUSES
+
+
+# Status classes, built once (the predicates above run per edge/evidence
+# during graph queries).
+_PROVED_STATUSES = frozenset({
+    ProofStatus.PROVED_L1_LTAC,
+    ProofStatus.PROVED_L2_SMT,
+    ProofStatus.PROVED_L2B_THEORY,
+    ProofStatus.PROVED_L3_ORACLE,
+})
+_ASSUMED_STATUSES = frozenset({
+    ProofStatus.ASSUMED_STUB,
+    ProofStatus.USER_AXIOM,
+})
+_TERMINAL_STATUSES = _PROVED_STATUSES | {ProofStatus.COUNTEREXAMPLE_FOUND}
 
 
 # ── Evidence kind (provenance asset type) ─────────────────────────
@@ -216,30 +223,38 @@ class EvidenceGraph:
 
     def _check_no_cycles(self, new_name: str, node: ContractNode) -> None:
         """Raise if adding [node] would create a cycle."""
+        # One visited set for all edges: a node already explored from an
+        # earlier callee is known not to reach [new_name], so each node is
+        # walked at most once per insertion.
+        visited: set[str] = set()
         for edge in node.edges:
             callee = edge.callee_name
             if callee == new_name:
                 raise ValueError(f"Self-loop: {new_name} → {new_name}")
             if callee in self.nodes:
-                if self._path_exists(callee, new_name):
+                if self._path_exists(callee, new_name, visited):
                     raise ValueError(f"Cycle: {new_name} → ... → {callee} → {new_name}")
 
-    def _path_exists(self, source: str, target: str) -> bool:
-        """Check if there's a path from source to target in the graph."""
-        visited: set[str] = set()
-        def dfs(name: str) -> bool:
+    def _path_exists(self, source: str, target: str,
+                     visited: set[str] | None = None) -> bool:
+        """Check if there's a path from source to target in the graph.
+        Nodes in [visited] are skipped; it is updated with every node
+        explored."""
+        # Explicit stack: call chains can be deeper than the recursion limit.
+        if visited is None:
+            visited = set()
+        stack = [source]
+        while stack:
+            name = stack.pop()
             if name == target:
                 return True
             if name in visited:
-                return False
+                continue
             visited.add(name)
             node = self.nodes.get(name)
             if node:
-                for edge in node.edges:
-                    if dfs(edge.callee_name):
-                        return True
-            return False
-        return dfs(source)
+                stack.extend(edge.callee_name for edge in node.edges)
+        return False
 
     def validate_all(self) -> dict[str, list[str]]:
         """Check composition: every internal node's callee edges are proved,
@@ -291,16 +306,40 @@ class EvidenceGraph:
                     break
         return callers
 
+    def callers_index(self) -> dict[str, tuple[str, ...]]:
+        """Return the reverse adjacency {callee: (callers...)}.
+
+        Built in one pass over all edges; each caller is listed once per
+        callee, in node order (same as get_callers).  Use this instead of
+        repeated get_callers calls, which each scan the whole graph."""
+        index: dict[str, list[str]] = {}
+        for name, node in self.nodes.items():
+            for edge in node.edges:
+                callers = index.setdefault(edge.callee_name, [])
+                if not callers or callers[-1] != name:
+                    callers.append(name)
+        return {callee: tuple(callers) for callee, callers in index.items()}
+
     def get_transitive_callers(self, name: str) -> list[str]:
         """Return all transitive callers (direct + indirect). Excludes [name]."""
-        visited: set[str] = set()
-        stack = list(self.get_callers(name))
+        return self.transitive_callers_of([name])
+
+    def transitive_callers_of(self, names) -> list[str]:
+        """Return the union of the transitive callers of every name in
+        [names], from one caller index and one traversal, so callers shared
+        by several roots are visited once.  A root is included only if it
+        calls another root (transitively)."""
+        callers_of = self.callers_index()
+        # Insertion-ordered dict as the visited set, so callers come back in
+        # discovery order rather than set-iteration order.
+        visited: dict[str, None] = {}
+        stack = [c for name in names for c in callers_of.get(name, ())]
         while stack:
             current = stack.pop()
             if current in visited:
                 continue
-            visited.add(current)
-            for caller in self.get_callers(current):
+            visited[current] = None
+            for caller in callers_of.get(current, ()):
                 if caller not in visited:
                     stack.append(caller)
         return list(visited)
@@ -313,26 +352,21 @@ class EvidenceGraph:
     def mark_stale(self, name: str) -> set[str]:
         """Mark all transitive callers of [name] as STALE (not [name] itself).
         Returns the set of node names that were affected."""
-        affected: set[str] = set()
-        for caller in self.get_callers(name):
-            self._mark_stale_recursive(caller, affected)
-        return affected
-
-    def _mark_stale_recursive(self, name: str, affected: set[str]) -> None:
-        if name in affected:
-            return
-        affected.add(name)
-        node = self.nodes.get(name)
-        if node:
-            for e in node.evidence:
-                if e.status.is_proved:
-                    e.status = ProofStatus.STALE
-            for e in node.edges:
-                for ev in e.evidence:
-                    if ev.status.is_proved:
-                        ev.status = ProofStatus.STALE
-        for caller in self.get_callers(name):
-            self._mark_stale_recursive(caller, affected)
+        # Collect the callers first (one caller index, one walk) and then
+        # mark them; recursing through get_callers rescanned every node's
+        # edges at each step.
+        affected = self.transitive_callers_of([name])
+        for caller in affected:
+            node = self.nodes.get(caller)
+            if node:
+                for e in node.evidence:
+                    if e.status.is_proved:
+                        e.status = ProofStatus.STALE
+                for e in node.edges:
+                    for ev in e.evidence:
+                        if ev.status.is_proved:
+                            ev.status = ProofStatus.STALE
+        return set(affected)
 
     def composition_theorem_holds(self) -> bool:
         """True iff the graph is well-founded and all contracts are valid
@@ -388,9 +422,15 @@ class EvidenceGraph:
         }
 
     def save(self, path: str | Path) -> None:
-        """Persist to a JSON file."""
+        """Persist to a JSON file.
+
+        Serialised in memory and written in one call: json.dump would issue
+        one small write per encoder chunk, and the graph is saved after
+        every recorded proof.
+        """
+        text = json.dumps(self.to_dict(), indent=2)
         with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+            f.write(text)
 
     @classmethod
     def load(cls, path: str | Path) -> "EvidenceGraph":
@@ -400,7 +440,11 @@ class EvidenceGraph:
             return graph
         with open(path) as f:
             data = json.load(f)
+        # Node names are dict keys and are looked up again through every
+        # edge's callee; interning them lets those lookups match by identity
+        # instead of comparing freshly decoded strings.
         for name, nd in data.get("nodes", {}).items():
+            name = sys.intern(name)
             spec_data = nd["spec"]
             spec = ContractSpec(
                 name=name,
@@ -419,22 +463,22 @@ class EvidenceGraph:
                     coq_file=e.get("coq_file", ""),
                     notes=e.get("notes", ""),
                 )
-                for e in nd.get("evidence", [])
+                for e in nd.get("evidence", ())
             ]
             edges = [
                 ContractEdge(
-                    callee_name=e["callee"],
-                    callee_spec=ContractSpec(name=e["callee"]),
+                    callee_name=(callee := sys.intern(e["callee"])),
+                    callee_spec=ContractSpec(name=callee),
                     target=e.get("target", ""),
                     evidence=[
                         Evidence(
                             kind=EvidenceKind(ev["kind"]),
                             status=ProofStatus(ev["status"]),
                         )
-                        for ev in e.get("evidence", [])
+                        for ev in e.get("evidence", ())
                     ],
                 )
-                for e in nd.get("edges", [])
+                for e in nd.get("edges", ())
             ]
             hashes = nd.get("hashes", {})
             node = ContractNode(
@@ -458,27 +502,32 @@ _ROOT_MARKERS = ["pyproject.toml"]
 def find_project_root(start: str | Path = ".") -> Path:
     """Walk up from [start] until a project-root marker is found.
     Falls back to the starting directory if no marker found."""
-    current = Path(start).resolve()
+    return _locate_project(start)[0]
+
+def _locate_project(start: str | Path) -> tuple[Path, bool]:
+    """Return (root, is_project) from a single walk up from [start];
+    is_project is False when no marker was found (root is then [start])."""
+    start_path = Path(start).resolve()
+    current = start_path
     # If start is a file, begin search from its parent directory
     if current.is_file():
         current = current.parent
     for _ in range(20):  # max depth
         for marker in _ROOT_MARKERS:
             if (current / marker).exists():
-                return current
+                return current, True
         parent = current.parent
         if parent == current:  # filesystem root
             break
         current = parent
-    return Path(start).resolve()
+    return start_path, False
 
 def get_graph(project_root: str | Path = ".") -> EvidenceGraph:
     """Return the evidence graph for [project_root], loading from disk if
     a persisted copy exists at <root>/.axiomander/evidence_graph.json.
     If [project_root] is not a known project (no pyproject.toml above it),
     returns an in-memory-only graph (not persisted)."""
-    root = find_project_root(project_root)
-    is_project = (root / "pyproject.toml").exists()
+    root, is_project = _locate_project(project_root)
     cache_key = str(root) if is_project else f"_mem_{id(root)}"
     if cache_key not in _GRAPHS:
         if is_project:
@@ -490,8 +539,8 @@ def get_graph(project_root: str | Path = ".") -> EvidenceGraph:
 
 def save_graph(project_root: str | Path = ".") -> None:
     """Persist the evidence graph to disk.  No-op for non-project roots."""
-    root = find_project_root(project_root)
-    if not (root / "pyproject.toml").exists():
+    root, is_project = _locate_project(project_root)
+    if not is_project:
         return  # temporary / outside project — not persisted
     cache_key = str(root)
     graph = _GRAPHS.get(cache_key)
@@ -7,6 +7,8 @@ Theory: docs/fluid-contract-language-theory.md, sections 1, 2, 9, 10, 11.
 
 from __future__ import annotations
 
+from collections import ChainMap
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Optional
@@ -191,7 +193,7 @@ class LowerCtx:
     post_bound:  the Coq binder the result variable renames to ("z"/"s"/"b"/"v").
     list_model:  Python list-param name -> Coq model name (e.g. xs -> M_xs).
     """
-    gamma: dict[str, Ty] = field(default_factory=dict)
+    gamma: Mapping[str, Ty] = field(default_factory=dict)
     post_var: str = ""
     post_bound: str = "z"
     list_model: dict[str, str] = field(default_factory=dict)
@@ -209,12 +211,12 @@ class LowerCtx:
         """Return a child context with `name : ty` added.
 
         Used for quantifier binders (forall/exists).  The original ctx is
-        unchanged -- LowerCtx is immutable (frozen dataclass).
+        unchanged -- LowerCtx is immutable (frozen dataclass).  The child
+        gamma layers the binder over the parent's (a ChainMap) instead of
+        copying every parameter binding.
         """
-        g = dict(self.gamma)
-        g[name] = ty
         return LowerCtx(
-            gamma=g,
+            gamma=ChainMap({name: ty}, self.gamma),
             post_var=self.post_var,
             post_bound=self.post_bound,
             list_model=self.list_model,
@@ -427,6 +429,15 @@ _Z_CMP_BOOL: dict[str, str] = {
     "<": "ltb", "<=": "leb", ">": "ltb", ">=": "leb",
     "=": "eqb", "<>": "eqb",
 }
+# Prop-mode integer comparisons, filled with the operand texts l and r.
+_Z_CMP_PROP_FMT: dict[str, str] = {
+    "<": "({l} <? {r}) = true",
+    "<=": "({l} <=? {r}) = true",
+    ">": "({r} <? {l}) = true",
+    ">=": "({r} <=? {l}) = true",
+    "=": "({l} =? {r}) = true",
+    "<>": "({l} =? {r}) <> true",
+}
 
 
 def _lower_binop(node: IRBinOp, ctx: LowerCtx, *,
@@ -476,16 +487,9 @@ def _integer_op_bool(op: str, l: str, r: str, bool_mode: bool) -> CoqTerm:
         coq_op = {"/": "/", "mod": "mod"}.get(op, op)
         return CoqTerm(f"({l} {coq_op} {r})", Ty.INT)
 
-    cmp_map = {
-        "<": f"({l} <? {r}) = true",
-        "<=": f"({l} <=? {r}) = true",
-        ">": f"({r} <? {l}) = true",
-        ">=": f"({r} <=? {l}) = true",
-        "=": f"({l} =? {r}) = true",
-        "<>": f"({l} =? {r}) <> true",
-    }
-    if op in cmp_map:
-        return CoqTerm(cmp_map[op], Ty.PROP)
+    fmt = _Z_CMP_PROP_FMT.get(op)
+    if fmt is not None:
+        return CoqTerm(fmt.format(l=l, r=r), Ty.PROP)
     coq_op = {"/": "/", "mod": "mod"}.get(op, op)
     return CoqTerm(f"({l} {coq_op} {r})", Ty.INT)
 
@@ -25,6 +25,37 @@ from .snakelet_ir import (
 )
 
 
+# Literals the lowerer emits over and over (len's dummy operand, negation,
+# empty bodies).  SnakeletIR nodes are never mutated after construction,
+# so one shared instance of each serves every use.
+_ZERO = SLit(lit_type="int", value="0")
+_UNIT = SLit(lit_type="unit", value="()")
+_TRUE = SLit(lit_type="bool", value="true")
+_FALSE = SLit(lit_type="bool", value="false")
+
+# Small integer literals (bounds, indices, 0/1 steps) interned up front.
+_SMALL_INTS = {n: SLit(lit_type="int", value=str(n)) for n in range(-128, 129)}
+
+
+def _int_lit(value) -> SLit:
+    lit = _SMALL_INTS.get(value) if type(value) is int else None
+    return lit if lit is not None else SLit(lit_type="int", value=str(value))
+
+# PyIR operator -> SnakeletIR binop name.  Augmented assignment ops are a
+# subset of the binary ops, so both use _BINOP_NAMES.
+_BINOP_NAMES = {"+": "add", "-": "sub", "*": "mul", "/": "div",
+                "==": "eq", "!=": "ne", "<": "lt", "<=": "le",
+                ">": "gt", ">=": "ge", "%": "mod"}
+_COMPARE_NAMES = {"==": "eq", "!=": "ne", "<": "lt", "<=": "le",
+                  ">": "gt", ">=": "ge", "is": "eq", "is not": "ne",
+                  "in": "in", "not in": "notin"}
+
+# Parameter types held as values (not heap locations): len() reads them
+# directly, and append/add rebinds them to a fresh SSA name.
+_LEN_VALUE_TYPES = frozenset({"str", "string", "dict", "set", "tuple"})
+_APPEND_VALUE_TYPES = _LEN_VALUE_TYPES | {"list"}
+
+
 class IrisLowerer:
     """Lower PyIR functions to SnakeletIR functions for Iris verification."""
 
@@ -39,10 +70,17 @@ class IrisLowerer:
         self._dict_params = dict_params or set()
         self._list_params = list_params or set()
         self._set_vars: set[str] = set()   # local variables assigned a set literal
+        # list_params and the value-typed params merged into one name set
+        # per use, so each check is a single membership test.
+        self._len_value_params = self._list_params | {
+            n for n, t in self._param_types.items() if t in _LEN_VALUE_TYPES}
+        self._append_value_params = self._list_params | {
+            n for n, t in self._param_types.items() if t in _APPEND_VALUE_TYPES}
         self._vc = 0
         self._pure_conditions: list[SPure] = []
         self._var_renames: dict[str, str] = {}  # Py name → current IR name (SSA)
         self._rename_root: dict[str, str] = {}  # IR name → Py name (reverse)
+        self._loc_cache: dict[tuple[str, str | None], str] = {}
 
     def _fresh_var(self, prefix: str = "t") -> str:
         self._vc += 1
@@ -54,51 +92,37 @@ class IrisLowerer:
 
     def _loc_of(self, obj: str, attr: str | None = None) -> str:
         """Resolve a Python field access to an abstract location."""
+        loc = self._loc_cache.get((obj, attr))
+        if loc is not None:
+            return loc
         if attr:
             key = f"{obj}.{attr}"
         else:
             key = obj
-        return self.loc_map.get(key, f"l__{key.replace('.', '_')}")
+        loc = self.loc_map.get(key, f"l__{key.replace('.', '_')}")
+        self._loc_cache[obj, attr] = loc
+        return loc
 
     def lower_expr(self, expr: PyExpr) -> Optional[SExpr]:
-        if isinstance(expr, PyName):
-            return SVar(name=self._current_var(expr.name))
-        if isinstance(expr, PyConstant):
-            return self._lower_constant(expr)
-        if isinstance(expr, PyBinaryOp):
-            return self._lower_binop(expr)
-        if isinstance(expr, PyUnaryOp):
-            return self._lower_unary(expr)
-        if isinstance(expr, PySubscript):
-            return self._lower_subscript(expr)
-        if isinstance(expr, PyAttribute):
-            return self._lower_attribute(expr)
-        if isinstance(expr, PyCall):
-            return self._lower_call(expr)
-        if isinstance(expr, PyCompare):
-            return self._lower_compare(expr)
-        if isinstance(expr, PyBooleanOp):
-            return self._lower_boolop(expr)
-        if isinstance(expr, PyListLiteral):
-            return self._lower_compound(expr.elements, "list", "[]")
-        if isinstance(expr, PyDictLiteral):
-            interleaved: list[SExpr] = []
-            for p in expr.pairs:
-                k = self.lower_expr(p["key"])
-                v = self.lower_expr(p["value"])
-                if k is None or v is None:
-                    return None
-                interleaved.append(k)
-                interleaved.append(v)
-            if all(isinstance(el, SLit) for el in interleaved):
-                lit_elements = [el for el in interleaved if isinstance(el, SLit)]
-                return SLit(lit_type="dict", value="", elements=lit_elements)
-            return SCompound(lit_type="dict", value="{}", elements=interleaved)
-        if isinstance(expr, PySetLiteral):
-            return self._lower_compound(expr.elements, "set", "{}")
-        if isinstance(expr, PyTupleLiteral):
-            return self._lower_compound(expr.elements, "tuple", "()")
-        return None
+        handler = _EXPR_LOWERINGS.get(type(expr))
+        return handler(self, expr) if handler is not None else None
+
+    def _lower_name(self, expr: PyName) -> SExpr:
+        return SVar(name=self._current_var(expr.name))
+
+    def _lower_dict_literal(self, expr: PyDictLiteral) -> Optional[SExpr]:
+        interleaved: list[SExpr] = []
+        for p in expr.pairs:
+            k = self.lower_expr(p["key"])
+            v = self.lower_expr(p["value"])
+            if k is None or v is None:
+                return None
+            interleaved.append(k)
+            interleaved.append(v)
+        if all(isinstance(el, SLit) for el in interleaved):
+            lit_elements = [el for el in interleaved if isinstance(el, SLit)]
+            return SLit(lit_type="dict", value="", elements=lit_elements)
+        return SCompound(lit_type="dict", value="{}", elements=interleaved)
 
     def _lower_compound(self, exprs, lit_type, empty_val):
         lowered: list[SExpr] = []
@@ -113,39 +137,39 @@ class IrisLowerer:
         return SCompound(lit_type=lit_type, value=empty_val, elements=lowered)
 
     def _lower_constant(self, expr: PyConstant) -> SExpr:
+        if expr.value is None:
+            # None is the unit value, as for a bare `return`.
+            return _UNIT
         if expr.py_type == "int":
-            return SLit(lit_type="int", value=str(expr.value))
+            return _int_lit(expr.value)
         if expr.py_type == "bool":
-            return SLit(lit_type="bool", value="true" if expr.value else "false")
+            return _TRUE if expr.value else _FALSE
         if expr.py_type == "str":
             return SLit(lit_type="string", value=expr.value)
         if expr.py_type == "float":
             # Emit as LitFloat; Coq computes z2float at compile-time
             return SLit(lit_type="float", value=str(expr.value))
         if isinstance(expr.value, bool):
-            return SLit(lit_type="bool", value="true" if expr.value else "false")
-        return SLit(lit_type="int", value=str(expr.value))
+            return _TRUE if expr.value else _FALSE
+        return _int_lit(expr.value)
 
     def _lower_binop(self, expr: PyBinaryOp) -> Optional[SExpr]:
         left = self.lower_expr(expr.left)
         right = self.lower_expr(expr.right)
         if left is None or right is None:
             return None
-        op_map = {"+": "add", "-": "sub", "*": "mul", "/": "div",
-                   "==": "eq", "!=": "ne", "<": "lt", "<=": "le",
-                   ">": "gt", ">=": "ge", "%": "mod"}
-        return SBinOp(op=op_map.get(expr.op, "add"), left=left, right=right)
+        return SBinOp(op=_BINOP_NAMES.get(expr.op, "add"), left=left, right=right)
 
     def _lower_unary(self, expr: PyUnaryOp) -> Optional[SExpr]:
         inner = self.lower_expr(expr.operand)
         if inner is None:
             return None
         if expr.op == "not":
-            return SBinOp(op="eq", left=inner, right=SLit(lit_type="bool", value="false"))
+            return SBinOp(op="eq", left=inner, right=_FALSE)
         if expr.op == "-":
             if isinstance(inner, SLit) and inner.lit_type == "int":
                 return SLit(lit_type="int", value=f"-{inner.value}")
-            return SBinOp(op="sub", left=SLit(lit_type="int", value="0"), right=inner)
+            return SBinOp(op="sub", left=_ZERO, right=inner)
         return inner
 
     def _lower_subscript(self, expr: PySubscript) -> Optional[SExpr]:
@@ -154,12 +178,13 @@ class IrisLowerer:
         key = self.lower_expr(expr.key)
         if obj_name is None or key is None:
             return None
+        obj_type = self._param_types.get(obj_name)
         # Dict access: lower to SApp call to transparent helper (not SDictGet)
-        if self._param_types.get(obj_name) == "dict":
+        if obj_type == "dict":
             return SApp(func="dict_index",
                         args=[SVar(name=obj_name), key])
         # String indexing: text[i] -> StrIndexOp
-        if self._param_types.get(obj_name) in ("str", "string"):
+        if obj_type in ("str", "string"):
             return SBinOp(op="str_index",
                           left=SVar(name=self._current_var(obj_name)),
                           right=key)
@@ -177,7 +202,7 @@ class IrisLowerer:
             from axiomander.oracle.shape_ir import lookup_enum_value, lookup_shape
             ev = lookup_enum_value(obj_name, expr.attr)
             if ev is not None:
-                return SLit(lit_type="int", value=str(ev))
+                return _int_lit(ev)
             # Pydantic/dataclass model param: field access via helper
             model_type = self._param_types.get(obj_name, "")
             if model_type and lookup_shape(model_type) is not None:
@@ -223,8 +248,8 @@ class IrisLowerer:
             if isinstance(type_arg, PyName):
                 type_name = type_arg.name
             if type_name in ("int", "bool"):
-                return SLit(lit_type="bool", value="true")
-            return SLit(lit_type="bool", value="false")
+                return _TRUE
+            return _FALSE
 
         # -- len(xs): LengthOp.  For heap-allocated lists, load first;
         #    for list/string/dict parameters, use the variable directly
@@ -232,15 +257,14 @@ class IrisLowerer:
         if expr.func == "len" and len(expr.args) == 1:
             arg = expr.args[0]
             if isinstance(arg, PyName):
-                if (arg.name in self._list_params
-                        or self._param_types.get(arg.name) in ("str", "string", "dict", "set", "tuple")):
+                if arg.name in self._len_value_params:
                     return SBinOp(op="length",
                                   left=SVar(name=self._current_var(arg.name)),
-                                  right=SLit(lit_type="int", value="0"))
+                                  right=_ZERO)
                 else:
                     return SBinOp(op="length",
                                   left=SLoad(loc=arg.name),
-                                  right=SLit(lit_type="int", value="0"))
+                                  right=_ZERO)
 
         # -- Method calls: xs.append(v) / s.startswith(p) / d.get(k, d) --
         if expr.is_method and "." in expr.func:
@@ -254,10 +278,8 @@ class IrisLowerer:
                 op_name = "set_add" if method == "add" else "append"
                 # Value-type param (list/dict/set/tuple): compute new value
                 # via AppendOp/SetAddOp and rebind the variable for subsequent code.
-                if (obj_name in self._list_params
-                        or obj_name in self._set_vars
-                        or self._param_types.get(obj_name) in
-                        ("list", "dict", "set", "tuple", "str", "string")):
+                if (obj_name in self._append_value_params
+                        or obj_name in self._set_vars):
                     old_name = self._current_var(obj_name)
                     fresh = self._fresh_var(obj_name)
                     self._var_renames[obj_name] = fresh
@@ -313,10 +335,7 @@ class IrisLowerer:
         right = self.lower_expr(expr.right)
         if left is None or right is None:
             return None
-        op_map = {"==": "eq", "!=": "ne", "<": "lt", "<=": "le",
-                   ">": "gt", ">=": "ge", "is": "eq", "is not": "ne",
-                   "in": "in", "not in": "notin"}
-        op = op_map.get(expr.op, "eq")
+        op = _COMPARE_NAMES.get(expr.op, "eq")
         # String containment: needle in haystack uses StrContainsOp
         # String containment: string literal needle → StrContainsOp
         if op == "in" and isinstance(left, SLit) and left.lit_type == "string":
@@ -326,11 +345,11 @@ class IrisLowerer:
             # not in -> str_contains == false
             return SBinOp(op="eq",
                           left=SBinOp(op="str_contains", left=left, right=right),
-                          right=SLit(lit_type="bool", value="false"))
+                          right=_FALSE)
         if op == "notin":
             return SBinOp(op="eq",
                           left=SBinOp(op="in", left=left, right=right),
-                          right=SLit(lit_type="bool", value="false"))
+                          right=_FALSE)
         return SBinOp(op=op, left=left, right=right)
 
     def _lower_boolop(self, expr: PyBooleanOp) -> Optional[SExpr]:
@@ -339,7 +358,7 @@ class IrisLowerer:
         if not parts:
             return None
         if expr.op == "not":
-            return SBinOp(op="eq", left=parts[0], right=SLit(lit_type="bool", value="false"))
+            return SBinOp(op="eq", left=parts[0], right=_FALSE)
         op = "and" if expr.op == "and" else "or"
         result = parts[0]
         for p in parts[1:]:
@@ -358,23 +377,8 @@ class IrisLowerer:
     # ── Statements ──────────────────────────────────────────────
 
     def lower_stmt(self, stmt: PyStmt) -> Optional[SExpr]:
-        if isinstance(stmt, PyAssign):
-            return self._lower_assign(stmt)
-        if isinstance(stmt, PyStoreAttr):
-            return self._lower_store_attr(stmt)
-        if isinstance(stmt, PyStoreSubscript):
-            return self._lower_store_subscript(stmt)
-        if isinstance(stmt, PyAugAssign):
-            return self._lower_augassign(stmt)
-        if isinstance(stmt, PyIf):
-            return self._lower_if(stmt)
-        if isinstance(stmt, PyReturn):
-            return self._lower_return(stmt)
-        if isinstance(stmt, PyRaise):
-            return self._lower_raise(stmt)
-        if isinstance(stmt, PyCall):
-            return self._lower_call(stmt)
-        return None
+        handler = _STMT_LOWERINGS.get(type(stmt))
+        return handler(self, stmt) if handler is not None else None
 
     def _lower_assign(self, stmt: PyAssign) -> Optional[SExpr]:
         val = self.lower_expr(stmt.value)
@@ -429,8 +433,7 @@ class IrisLowerer:
         if isinstance(stmt.target, PyName):
             # Local variable: simple assignment
             current = SVar(name=stmt.target)
-            op_map = {"+": "add", "-": "sub", "*": "mul", "/": "div", "%": "mod"}
-            binop = SBinOp(op=op_map.get(stmt.op, "add"), left=current, right=val)
+            binop = SBinOp(op=_BINOP_NAMES.get(stmt.op, "add"), left=current, right=val)
             return SLet(var=stmt.target, value=binop, body=SVar(stmt.target))
         return None
 
@@ -444,7 +447,7 @@ class IrisLowerer:
 
     def _lower_return(self, stmt: PyReturn) -> Optional[SExpr]:
         if stmt.value is None:
-            return SReturn(value=SLit(lit_type="unit", value="()"))
+            return SReturn(value=_UNIT)
         val = self.lower_expr(stmt.value)
         if val is None:
             return None
@@ -467,7 +470,7 @@ class IrisLowerer:
     def _lower_body(self, stmts: list[PyStmt]) -> SExpr:
         exprs = [s for s in (self.lower_stmt(s) for s in stmts) if s is not None]
         if not exprs:
-            return SLit(lit_type="unit", value="()")
+            return _UNIT
         if len(exprs) == 1:
             return exprs[0]
         return SSeq(exprs=exprs)
@@ -503,3 +506,34 @@ class IrisLowerer:
             post_pure=post_pure,
             modifies=modifies,
         )
+
+
+# Exact PyIR node class -> lowering method.  The PyIR node classes do not
+# subclass one another, so one dict lookup on type() replaces the isinstance
+# cascade (match/case class patterns would still test each case in turn).
+_EXPR_LOWERINGS = {
+    PyName: IrisLowerer._lower_name,
+    PyConstant: IrisLowerer._lower_constant,
+    PyBinaryOp: IrisLowerer._lower_binop,
+    PyUnaryOp: IrisLowerer._lower_unary,
+    PySubscript: IrisLowerer._lower_subscript,
+    PyAttribute: IrisLowerer._lower_attribute,
+    PyCall: IrisLowerer._lower_call,
+    PyCompare: IrisLowerer._lower_compare,
+    PyBooleanOp: IrisLowerer._lower_boolop,
+    PyListLiteral: lambda self, e: self._lower_compound(e.elements, "list", "[]"),
+    PyDictLiteral: IrisLowerer._lower_dict_literal,
+    PySetLiteral: lambda self, e: self._lower_compound(e.elements, "set", "{}"),
+    PyTupleLiteral: lambda self, e: self._lower_compound(e.elements, "tuple", "()"),
+}
+
+_STMT_LOWERINGS = {
+    PyAssign: IrisLowerer._lower_assign,
+    PyStoreAttr: IrisLowerer._lower_store_attr,
+    PyStoreSubscript: IrisLowerer._lower_store_subscript,
+    PyAugAssign: IrisLowerer._lower_augassign,
+    PyIf: IrisLowerer._lower_if,
+    PyReturn: IrisLowerer._lower_return,
+    PyRaise: IrisLowerer._lower_raise,
+    PyCall: IrisLowerer._lower_call,
+}
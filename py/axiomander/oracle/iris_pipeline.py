@@ -29,11 +29,12 @@ from __future__ import annotations
 
 import ast
 import os
+import re
 from dataclasses import dataclass, field
 from typing import Optional
 
 from axiomander.oracle.contract_ir_iris import _collect_vars
-from axiomander.oracle.contract_linter import ContractLinter
+from axiomander.oracle.contract_linter import ContractLinter, _is_docstring_stmt
 from axiomander.oracle.iris_lowerer import IrisLowerer
 from axiomander.oracle.iris_proof_gen import (
     FunTable, IrisGenError, IrisProof, generate,
@@ -47,6 +48,7 @@ from axiomander.oracle.py_ir import (
     PyFor, PyIf, PyName, PyRaise, PyReturn, PyStmt, PyStoreSubscript, PyTry, PyWhile,
 )
 from axiomander.oracle.py_ir_translator import PyIRTranslator
+from axiomander.oracle.smt_export import _find_solver
 from axiomander.oracle.snakelet_ir import (
     SAlloc, SApp, SBinOp, SCompound, SDictGet, SDictSet, SExpr, SIf, SLet, SLit, SLoad, SRaise, SReturn, SSeq,
     SStore, STry, SVar, SWhile, SFor,
@@ -179,6 +181,19 @@ def extract_contracts(
     body = list(fn_node.body)
     pres: list[str] = []
 
+    # Trailing asserts are visited by the raises scan and up to twice more
+    # by the postcondition scan; lint each assert test once.
+    _post_irs: dict[int, object] = {}
+
+    def _post_ir(test: ast.expr):
+        key = id(test)
+        try:
+            return _post_irs[key]
+        except KeyError:
+            ir = _post_irs[key] = post_linter.lint_expression(
+                test, translate=False).ir
+            return ir
+
     # Extract raises() contracts FIRST (position-independent): any assert
     # whose test is a raises(ExcType, cond) call.  Removing them before the
     # pre/post scan prevents a trailing raises() assert from being mistaken
@@ -188,10 +203,10 @@ def extract_contracts(
     _kept: list[ast.stmt] = []
     for stmt in body:
         if isinstance(stmt, ast.Assert):
-            linted = post_linter.lint_expression(stmt.test)
-            if linted.ir is not None and isinstance(linted.ir, RaisesExpr):
-                cond_coq = _prop(linted.ir.cond)
-                stmt_exc = linted.ir.exc_type
+            ir = _post_ir(stmt.test)
+            if ir is not None and isinstance(ir, RaisesExpr):
+                cond_coq = _prop(ir.cond)
+                stmt_exc = ir.exc_type
                 if stmt_exc:
                     if stmt_exc in raises:
                         raises[stmt_exc] = f"({raises[stmt_exc]}) /\\ ({cond_coq})"
@@ -204,7 +219,7 @@ def extract_contracts(
     # Leading asserts = precondition
     pre_irs: list = []
     while body and isinstance(body[0], ast.Assert):
-        linted = pre_linter.lint_expression(body[0].test)
+        linted = pre_linter.lint_expression(body[0].test, translate=False)
         if linted.ir is not None:
             pres.append(_pre(linted.ir))
             pre_irs.append(linted.ir)
@@ -235,28 +250,28 @@ def extract_contracts(
         if post_asserts and ret_var is not None:
             posts: list[str] = []
             for a in post_asserts:
-                linted = post_linter.lint_expression(a.test)
-                if linted.ir is not None:
+                ir = _post_ir(a.test)
+                if ir is not None:
                     # Strip the existential wrapper so we can share [z].
-                    prop = _prop(linted.ir, post_var=ret_var,
+                    prop = _prop(ir, post_var=ret_var,
                                   post_bound="z")
                     posts.append(prop)
             if len(posts) == 1:
                 # Single assert: use the standard wrapper.
-                linted = post_linter.lint_expression(post_asserts[0].test)
-                if linted.ir is not None:
-                    _post_expr = linted.ir
-                post = _post(linted.ir, ret_var, result_kind, ghost_resolver)
+                ir = _post_ir(post_asserts[0].test)
+                if ir is not None:
+                    _post_expr = ir
+                post = _post(ir, ret_var, result_kind, ghost_resolver)
             elif posts:
                 # Shared existential: exists z, v = LitInt z /\ P1 /\ P2.
                 # Ghost vars from ghost_resolver are nested inside.
                 gh = ghost_resolver or {}
                 ghost_vars_used: list[str] = []
                 for a in post_asserts:
-                    linted = post_linter.lint_expression(a.test)
-                    if linted.ir is not None:
+                    ir = _post_ir(a.test)
+                    if ir is not None:
                         ghost_vars_used.extend(
-                            sorted(_collect_vars(linted.ir).intersection(gh.values())))
+                            sorted(_collect_vars(ir).intersection(gh.values())))
                 ghost_binders = "".join(
                     f"(exists ({gv} : Z), " for gv in dict.fromkeys(ghost_vars_used))
                 ghost_closers = "".join(")" for _ in dict.fromkeys(ghost_vars_used))
@@ -304,6 +319,7 @@ def _detect_predicates(source: str) -> tuple[dict, list[str]]:
         return predicates, fixpoints
     from axiomander.oracle.predicate_def import classify_recursion, _find_self_calls, RecKind
     from axiomander.oracle.slice_normalizer import emit_fixpoint
+    fixpoint_kinds = frozenset({RecKind.STRUCTURAL, RecKind.MEASURED})
     for node in ast.walk(tree):
         if not isinstance(node, ast.FunctionDef):
             continue
@@ -315,7 +331,7 @@ def _detect_predicates(source: str) -> tuple[dict, list[str]]:
         body_expr = returns[-1].value if returns else None
         predicates[node.name] = (params, body_expr, [], None, None)
         pd = classify_recursion(node)
-        if pd.rec_kind in (RecKind.STRUCTURAL, RecKind.MEASURED):
+        if pd.rec_kind in fixpoint_kinds:
             fixpoints.append(emit_fixpoint(pd))
     return predicates, fixpoints
 
@@ -338,7 +354,7 @@ def _build_resource_premises(dc) -> tuple[list[str], list[str], list[str]]:
         owned_locs[name] = loc
         premises.append(f"{loc} ↦ LitInt 0")  # placeholder: numeric value
     # may_modify entries use the same owned-location mapping
-    for mod in dc.frame.get("may_modify", []):
+    for mod in dc.frame.get("may_modify", ()):
         # mod is like "Orders.row(order_id)" — extract the owned variable
         parts = mod.split("(")[0].strip().split(".")
         owned_var = parts[0].lower()  # "Orders" -> "order_row" 
@@ -361,7 +377,7 @@ def _build_resource_premises(dc) -> tuple[list[str], list[str], list[str]]:
     # may_emit clauses -> ghost token premises (pure placeholders)
     ghost_prems: list[str] = []
     emission_tokens: list[str] = []
-    for emit in dc.frame.get("may_emit", []):
+    for emit in dc.frame.get("may_emit", ()):
         topic = emit.split('"')[1] if '"' in emit else emit
         # Placeholder: pure premise until ghost RA is built
         tok = f'⌜may_emit = "{topic}"%string⌝'
@@ -484,7 +500,7 @@ def _extract_while_invariants(stmts: list[ast.stmt], acc: list[list],
             invs = []
             for b in s.body:
                 if isinstance(b, ast.Assert):
-                    linted = linter.lint_expression(b.test)
+                    linted = linter.lint_expression(b.test, translate=False)
                     if linted.ir is not None:
                         invs.append(linted.ir)   # keep Expr, compile late
             acc.append(invs)
@@ -493,7 +509,7 @@ def _extract_while_invariants(stmts: list[ast.stmt], acc: list[list],
             invs = []
             for b in s.body:
                 if isinstance(b, ast.Assert):
-                    linted = linter.lint_expression(b.test)
+                    linted = linter.lint_expression(b.test, translate=False)
                     if linted.ir is not None:
                         invs.append(linted.ir)
             acc.append(invs)
@@ -797,11 +813,15 @@ def discharge_inv_obligations(proof, axiom_offset: int = 0) -> list[str]:
     """Send all invariant update obligations to SMT and populate
     WhileInv.inv_axiom_indices.  Returns new axiom Coq Prop strings."""
     obligations = collect_inv_obligations(proof)
+    # SMT queries built directly from to_smt() output — no string parsing.
+    # All obligations go to one solver run instead of one process each.
+    verdicts = _smt_check_batch([
+        (smt_hyps, smt_conc,
+         ["z", "bound"] + [f"a_{i}" for i in range(len(wi.extra_cells))])
+        for wi, _, _, smt_hyps, smt_conc in obligations
+    ])
     new_axioms: list[str] = []
-    for wi, j, coq_prop, smt_hyps, smt_conc in obligations:
-        # SMT query built directly from to_smt() output — no string parsing
-        verified = _smt_check(smt_hyps, smt_conc,
-                               extra_vars=["z", "bound"] + [f"a_{i}" for i in range(len(wi.extra_cells))])
+    for (wi, j, coq_prop, _, _), verified in zip(obligations, verdicts):
         if not verified:
             continue
         axidx = axiom_offset + len(new_axioms)
@@ -811,13 +831,9 @@ def discharge_inv_obligations(proof, axiom_offset: int = 0) -> list[str]:
     return new_axioms
 
 
-def _smt_check(hyps: list[str], conc: str, extra_vars: list[str] | None = None) -> bool:
-    """Check UNSAT of (hyps /\ not conc) using cvc4/z3.  All strings are
-    already SMT-LIB format (produced by contract_ir.Expr.to_smt())."""
-    import subprocess, tempfile, shutil, os
-    solver = next((s for s in ("cvc4", "z3", "cvc5") if shutil.which(s)), None)
-    if not solver:
-        return False
+def _smt_query_vars(hyps: list[str], conc: str,
+                    extra_vars: list[str] | None = None) -> set[str]:
+    """Integer variables to declare for an _smt_check query."""
     import re
     # Collect variable names from hypotheses and conclusion
     all_text = " ".join(hyps) + " " + conc
@@ -826,16 +842,30 @@ def _smt_check(hyps: list[str], conc: str, extra_vars: list[str] | None = None)
     vars_found -= KEYWORDS
     if extra_vars:
         vars_found.update(extra_vars)
-    lines = ["(set-logic QF_NIA)"]
-    for v in sorted(vars_found):
-        lines.append(f"(declare-fun {v} () Int)")
-    for h in hyps:
-        lines.append(f"(assert {h})")
+    return vars_found
+
+
+def _smt_query_lines(hyps: list[str], conc: str,
+                     extra_vars: list[str] | None = None) -> list[str]:
+    """Declarations and assertions for UNSAT of (hyps /\ not conc)."""
+    vars_found = _smt_query_vars(hyps, conc, extra_vars)
+    lines = [f"(declare-fun {v} () Int)" for v in sorted(vars_found)]
+    lines.extend(f"(assert {h})" for h in hyps)
     lines.append(f"(assert (not {conc}))")
-    lines.append("(check-sat)")
+    return lines
+
+
+def _smt_check(hyps: list[str], conc: str, extra_vars: list[str] | None = None) -> bool:
+    """Check UNSAT of (hyps /\ not conc) using cvc4/z3.  All strings are
+    already SMT-LIB format (produced by contract_ir.Expr.to_smt())."""
+    import subprocess, os
+    solver = _find_solver()
+    if not solver:
+        return False
+    lines = ["(set-logic QF_NIA)", *_smt_query_lines(hyps, conc, extra_vars),
+             "(check-sat)"]
     smt_src = "\n".join(lines)
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.smt2', delete=False) as f:
-        f.write(smt_src); tf = f.name
+    tf = _write_temp(smt_src, ".smt2")
     try:
         r = subprocess.run([solver, tf], capture_output=True, text=True, timeout=15)
         return "unsat" in r.stdout
@@ -846,12 +876,60 @@ def _smt_check(hyps: list[str], conc: str, extra_vars: list[str] | None = None)
         except OSError: pass
 
 
+def _smt_check_batch(
+    queries: list[tuple[list[str], str, list[str] | None]],
+) -> list[bool]:
+    """Run several _smt_check queries (hyps, conc, extra_vars) in one solver
+    process, each scoped by push/pop.  Declarations and the leading
+    hypotheses shared by every query are asserted once, outside the scopes,
+    so each check adds only its own delta.  Falls back to one process per
+    query if the solver does not answer every check-sat cleanly."""
+    import subprocess, os
+    if len(queries) < 2:
+        return [_smt_check(*q) for q in queries]
+    solver = _find_solver()
+    if not solver:
+        return [False] * len(queries)
+    shared = 0
+    first_hyps = queries[0][0]
+    while (shared < len(first_hyps)
+           and all(len(h) > shared and h[shared] == first_hyps[shared]
+                   for h, _, _ in queries)):
+        shared += 1
+    all_vars: set[str] = set()
+    for q in queries:
+        all_vars |= _smt_query_vars(*q)
+    lines = ["(set-option :incremental true)", "(set-logic QF_NIA)"]
+    lines.extend(f"(declare-fun {v} () Int)" for v in sorted(all_vars))
+    lines.extend(f"(assert {h})" for h in first_hyps[:shared])
+    for hyps, conc, _ in queries:
+        lines.append("(push 1)")
+        lines.extend(f"(assert {h})" for h in hyps[shared:])
+        lines.append(f"(assert (not {conc}))")
+        lines.append("(check-sat)")
+        lines.append("(pop 1)")
+    tf = _write_temp("\n".join(lines), ".smt2")
+    try:
+        r = subprocess.run([solver, tf], capture_output=True, text=True,
+                           timeout=15 * len(queries))
+        answers = [a for a in (l.strip() for l in r.stdout.splitlines())
+                   if a in ("sat", "unsat", "unknown")]
+        if len(answers) == len(queries) and "(error" not in r.stdout:
+            return [a == "unsat" for a in answers]
+    except Exception:
+        pass
+    finally:
+        try: os.unlink(tf)
+        except OSError: pass
+    return [_smt_check(*q) for q in queries]
+
+
 def _verify_coq_prop_with_smt(coq_prop: str) -> bool:
     """Send a universally-quantified Coq Z implication to the SMT solver.
     Returns True if UNSAT (i.e., the proposition is valid)."""
-    import re, subprocess, tempfile, shutil, os
+    import re, subprocess, os
 
-    solver = next((s for s in ("cvc4", "z3", "cvc5") if shutil.which(s)), None)
+    solver = _find_solver()
     if not solver:
         return False
 
@@ -954,8 +1032,7 @@ def _verify_coq_prop_with_smt(coq_prop: str) -> bool:
     lines.append("(check-sat)")
     smt_src = "\n".join(lines)
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.smt2', delete=False) as f:
-        f.write(smt_src); tf = f.name
+    tf = _write_temp(smt_src, ".smt2")
     try:
         r = subprocess.run([solver, tf], capture_output=True, text=True, timeout=15)
         return "unsat" in r.stdout
@@ -1701,10 +1778,7 @@ def python_to_iris_proof(source: str,
 
     # Strip docstring string-node from the body before lowering (it leaks
     # into the IR as a LitString literal otherwise).
-    _is_str_expr = (
-        lambda s: isinstance(s, ast.Expr) and isinstance(s.value, ast.Constant)
-        and isinstance(s.value.value, str))
-    target.body = [s for s in target.body if not _is_str_expr(s)]
+    target.body = [s for s in target.body if not _is_docstring_stmt(s)]
 
     # Body: PyIR -> SnakeletIR -> ANF
     fn = PyIRTranslator().translate_function(target)
@@ -1842,15 +1916,12 @@ def capture_residual(source: str,
     attempt; if empty, we run coqc internally and use its output to
     locate the failure.
     """
-    import re, tempfile, subprocess, os
+    import re, subprocess, os
     proof = python_to_iris_proof(source, table, func_name=func_name,
                                  _cwd=_cwd)
     full_text = proof.emit_exn()
     if not error_output:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.v',
-                                         delete=False) as f:
-            f.write(full_text)
-            tf = f.name
+        tf = _write_temp(full_text, ".v")
         try:
             r = subprocess.run(
                 ["coqc", "-R", _coq_root(), "", tf],
@@ -1869,21 +1940,41 @@ def capture_residual(source: str,
     if not m:
         return None
     err_line = int(m.group(1))
-    emit_lines = full_text.splitlines()
+    before_error = "\n".join(full_text.splitlines()[:max(err_line - 1, 0)])
     # Find the LAST stage whose emit line is strictly before the error
-    # line.  (The error is often at Qed, not the failing tactic.)
+    # line.  (The error is often at Qed, not the failing tactic.)  One
+    # scan over the text before the error; the pattern takes the first
+    # marker on each line, as the stage tags are emitted one per line.
     stage_id = None
-    for i, el in enumerate(emit_lines):
-        if (i + 1) >= err_line:
-            break
-        s_match = re.search(r'\[\s*(\d+)\s*\]', el)
-        if s_match:
-            stage_id = int(s_match.group(1))
+    for s_match in _STAGE_MARKER_RE.finditer(before_error):
+        stage_id = int(s_match.group(1))
     if stage_id is None:
         return None
     return proof.emit_residual(stage_id + 1)  # capture goal AT this stage
 
 
+# First "[N]" stage tag on a line of an emitted proof.
+_STAGE_MARKER_RE = re.compile(r'^.*?\[\s*(\d+)\s*\]', re.MULTILINE)
+
+
+def _write_temp(text: str, suffix: str) -> str:
+    """Write [text] to a fresh temp file and return its path.
+
+    Raw fd write of the UTF-8 bytes: these files are written once per
+    solver/coqc call and read only by the subprocess, so the buffered
+    text-file wrapper buys nothing.  The caller unlinks the file.
+    """
+    import tempfile
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        data = memoryview(text.encode("utf-8"))
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    return path
+
+
 def _coq_root() -> str:
     """Return the path to the coq source root."""
     import pathlib
@@ -1916,7 +2007,7 @@ def _iris_compute_hashes(source: str, func_name: str) -> tuple[str, str, str]:
         linter = ContractLinter(params, "precondition")
         for stmt in _ast.walk(func_node):
             if isinstance(stmt, _ast.Assert):
-                lr = linter.lint_expression(stmt.test)
+                lr = linter.lint_expression(stmt.test, translate=False)
                 if lr.ir is not None:
                     try:
                         contracts_text += lr.ir.to_python() + ";"
@@ -1931,15 +2022,18 @@ def _iris_compute_hashes(source: str, func_name: str) -> tuple[str, str, str]:
     return src_hash, contracts_hash, full_hash
 
 
-def _iris_cache_get(source: str, func_name: str) -> GoalStatus | None:
-    """Return cached GoalStatus if hash matches, else None."""
+def _iris_cache_get(source: str, func_name: str,
+                    full_hash: str | None = None) -> GoalStatus | None:
+    """Return cached GoalStatus if hash matches, else None.
+
+    Pass a precomputed ``full_hash`` to skip re-hashing the source.
+    """
     from axiomander.oracle.cache import VerificationCache
     import json
-    _, _, full_hash = _iris_compute_hashes(source, func_name)
+    if full_hash is None:
+        _, _, full_hash = _iris_compute_hashes(source, func_name)
     store = VerificationCache()
     entry_path = store.entries_dir / f"iris_{full_hash}.json"
-    if not entry_path.exists():
-        return None
     try:
         data = json.loads(entry_path.read_text())
         if data.get("full_hash") != full_hash:
@@ -1955,15 +2049,19 @@ def _iris_cache_get(source: str, func_name: str) -> GoalStatus | None:
             suggested_action=Action(data["suggested_action"]) if data.get("suggested_action") else None,
             suggestion_text=data.get("suggestion_text", ""),
         )
+    except FileNotFoundError:
+        return None
     except (json.JSONDecodeError, KeyError, ValueError):
         return None
 
 
-def _iris_cache_put(source: str, func_name: str, status: GoalStatus) -> None:
+def _iris_cache_put(source: str, func_name: str, status: GoalStatus,
+                    full_hash: str | None = None) -> None:
     """Store a GoalStatus in the file-based cache."""
     from axiomander.oracle.cache import VerificationCache
     import json
-    _, _, full_hash = _iris_compute_hashes(source, func_name)
+    if full_hash is None:
+        _, _, full_hash = _iris_compute_hashes(source, func_name)
     store = VerificationCache()
     entry_path = store.entries_dir / f"iris_{full_hash}.json"
     entry_path.write_text(json.dumps({
@@ -2000,24 +2098,23 @@ def verify_iris_safe(source: str,
     """
     import time
 
+    full_hash = None
     if use_cache:
-        cached = _iris_cache_get(source, func_name)
+        # Hash once: the same key serves the lookup and the store below.
+        _, _, full_hash = _iris_compute_hashes(source, func_name)
+        cached = _iris_cache_get(source, func_name, full_hash=full_hash)
         if cached is not None:
             return cached
 
     t0 = time.monotonic()
     import subprocess
-    import tempfile
     import os
     try:
         proof = python_to_iris_proof(
             source, table, func_name=func_name, _cwd=_cwd, **kwargs)
         full_text = proof.emit_exn()
 
-        with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".v", delete=False) as f:
-            f.write(full_text)
-            tf = f.name
+        tf = _write_temp(full_text, ".v")
         try:
             r = subprocess.run(
                 ["coqc", "-R", _coq_root(), "", tf],
@@ -2061,7 +2158,7 @@ def verify_iris_safe(source: str,
         _classify_iris_failure(status, source, func_name)
 
     if use_cache:
-        _iris_cache_put(source, func_name, status)
+        _iris_cache_put(source, func_name, status, full_hash=full_hash)
     return status
 
 
@@ -2116,16 +2213,48 @@ def _has_loop(func_node: ast.FunctionDef) -> bool:
     return False
 
 
+def _verify_iris_named(source: str, table: FunTable, cwd: str,
+                       kwargs: dict, name: str) -> GoalStatus:
+    """verify_iris_safe with the per-function name last (pool worker)."""
+    return verify_iris_safe(source, name, table, _cwd=cwd, **kwargs)
+
+
+def _pooled_iris_result(source: str, name: str, future) -> GoalStatus:
+    """Result of a pooled verification, or UNPROVED if the worker failed.
+
+    verify_iris_safe already isolates faults inside the worker; this covers
+    what can only go wrong across the process boundary (a crashed worker
+    breaking the pool, arguments or results that do not pickle).
+    """
+    try:
+        return future.result()
+    except Exception as exc:
+        status = GoalStatus(
+            name=name,
+            goal_statement="",
+            level=ProofLevel.UNPROVED,
+            error_detail=f"{type(exc).__name__}: {exc}",
+        )
+        _classify_iris_failure(status, source, name)
+        return status
+
+
 def run_iris_pipeline(python_file: str,
                       table: FunTable,
                       func_name: str | None = None,
                       quiet: bool = False,
+                      jobs: int = 1,
                       **kwargs) -> PipelineReport:
     """Batch-verify Iris-contracted functions in a Python file.
 
     Each function is verified independently via verify_iris_safe
     (fault isolation).  Returns a PipelineReport aggregating all
     GoalStatus results.
+
+    With jobs > 1 the functions are verified in a process pool; each
+    worker has its own copy of the module-level shape/enum registries,
+    so the per-function runs do not interfere.  Goals are reported in
+    source order either way.
     """
     import time
     from pathlib import Path
@@ -2143,16 +2272,33 @@ def run_iris_pipeline(python_file: str,
     t0 = time.monotonic()
     goals: list[GoalStatus] = []
 
-    for name, _func_node in func_pairs:
-        result = verify_iris_safe(
-            source, name, table, _cwd=str(py_file.parent), **kwargs)
-        goals.append(result)
-        if not quiet:
-            if result.is_proved():
-                print(f"  PROVED   {name}  [{result.level.value}]")
-            else:
-                detail = result.error_detail or ""
-                print(f"  UNPROVED {name}  {detail[:80]}")
+    cwd = str(py_file.parent)
+    names = [n for n, _ in func_pairs]
+    pool = None
+    if jobs > 1 and len(names) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        futures = [
+            pool.submit(_verify_iris_named, source, table, cwd, kwargs, name)
+            for name in names]
+        results = (_pooled_iris_result(source, name, fut)
+                   for name, fut in zip(names, futures))
+    else:
+        results = (_verify_iris_named(source, table, cwd, kwargs, name)
+                   for name in names)
+
+    try:
+        for name, result in zip(names, results):
+            goals.append(result)
+            if not quiet:
+                if result.is_proved():
+                    print(f"  PROVED   {name}  [{result.level.value}]")
+                else:
+                    detail = result.error_detail or ""
+                    print(f"  UNPROVED {name}  {detail[:80]}")
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     elapsed_ms = (time.monotonic() - t0) * 1000.0
     proved = sum(1 for g in goals if g.is_proved())
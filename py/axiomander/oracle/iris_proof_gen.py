@@ -441,6 +441,14 @@ def _emit_totality(table: FunTable) -> str:
 
 
 def _emit_table_section(table: FunTable) -> str:
+    # Most functions are verified against an empty callee table; that
+    # section is the same text every time, so it is rendered once.
+    if not table:
+        return _EMPTY_TABLE_SECTION
+    return _render_table_section(table)
+
+
+def _render_table_section(table: FunTable) -> str:
     parts = []
     for fname, entry in table.items():
         if isinstance(entry, OpaqueSpec):
@@ -455,6 +463,9 @@ def _emit_table_section(table: FunTable) -> str:
     return "\n\n".join(parts)
 
 
+_EMPTY_TABLE_SECTION = _render_table_section({})
+
+
 # -- Stage generation -----------------------------------------------------
 
 def _is_value(e: SExpr) -> bool:
@@ -946,14 +957,16 @@ def _emit_while_inv_lemma_exn(wi: WhileInv) -> str:
     extra = wi.extra_cells or []
 
     # String-substitute cell variable names with Coq [Val (LitLoc l_...)]
-    # in the condition and body.
-    cond = wi.cond_coq.replace(f'(Var "{cell}")', f'(Val (LitLoc {cell}))')
-    cond = cond.replace(f'(Val (LitInt {bound_val}))', '(Val (LitInt bound))')
-    body = wi.body_coq.replace(f'(Var "{cell}")', f'(Val (LitLoc {cell}))')
-    body = body.replace(f'(Val (LitInt {bound_val}))', '(Val (LitInt bound))')
-    for ec in extra:
-        cond = cond.replace(f'(Var "{ec}")', f'(Val (LitLoc {ec}))')
-        body = body.replace(f'(Var "{ec}")', f'(Val (LitLoc {ec}))')
+    # in the condition and body.  The (old, new) pairs are built once and
+    # applied to both.
+    subs = [(f'(Var "{cell}")', f'(Val (LitLoc {cell}))'),
+            (f'(Val (LitInt {bound_val}))', '(Val (LitInt bound))')]
+    subs.extend((f'(Var "{ec}")', f'(Val (LitLoc {ec}))') for ec in extra)
+    cond = wi.cond_coq
+    body = wi.body_coq
+    for old, new in subs:
+        cond = cond.replace(old, new)
+        body = body.replace(old, new)
 
     body_lines = _emit_stage_lines(wi.body_stages, 0, "      ")
     body_proof = "\n".join(body_lines)
@@ -1158,12 +1171,12 @@ def _emit_while_str_stage_exn(ws: WhileStr, indent: str) -> list[str]:
 def _extract_extra_cells(body_coq: str, counter_cell: str) -> list[str]:
     """Find extra heap cell variable names in the body expression."""
     import re
-    out: list[str] = []
-    for m in re.finditer(r'Var\s+"(l\d*)"', body_coq):
-        v = m.group(1)
-        if v != counter_cell and v not in out:
-            out.append(v)
-    return out
+    # dict keys give first-seen order with O(1) membership; a list scan per
+    # match is quadratic in the number of cell references.
+    cells = dict.fromkeys(m.group(1)
+                          for m in re.finditer(r'Var\s+"(l\d*)"', body_coq))
+    cells.pop(counter_cell, None)
+    return list(cells)
 
 
 def _emit_pure_counter_while(wi: WhileInv, indent: str) -> list[str]:
@@ -1480,6 +1493,18 @@ _HEADER_EXN = (
     "Open Scope Z_scope.\n"
 )
 
+# Opening of the generated proof section, placed after the fun table
+# (joined with "\n" like the surrounding parts, hence the leading blank).
+_SECTION_OPEN_EXN = (
+    "\n"
+    "Section generated_proofs.\n"
+    "  Context `{!snakeletExn_heapGS_gen hlc Sigma}.\n"
+    "  Local Notation \"'WPE' e {{ Q } }\" := (wp_exn e Q)\n"
+    "    (at level 20, e, Q at level 200) : bi_scope.\n"
+    "  Local Notation \"l ↦ v\" := (pointsto l (DfracOwn 1) v)\n"
+    "    (at level 20) : bi_scope.\n"
+)
+
 
 @dataclass
 class IrisProof:
@@ -1566,14 +1591,7 @@ class IrisProof:
         if self.axioms:
             parts.append("")
         parts.append(self.table_coq)
-        parts.append("")
-        parts.append("Section generated_proofs.")
-        parts.append("  Context `{!snakeletExn_heapGS_gen hlc Sigma}.")
-        parts.append("  Local Notation \"'WPE' e {{ Q } }\" := (wp_exn e Q)")
-        parts.append("    (at level 20, e, Q at level 200) : bi_scope.")
-        parts.append("  Local Notation \"l ↦ v\" := (pointsto l (DfracOwn 1) v)")
-        parts.append("    (at level 20) : bi_scope.")
-        parts.append("")
+        parts.append(_SECTION_OPEN_EXN)
         # Declare resource locations from owns declarations.
         if self.resource_premises:
             locs = set()
@@ -1584,8 +1602,9 @@ class IrisProof:
                     locs.add(loc)
                     parts.append(f"  Context ({loc} : loc).")
             parts.append("")
-        # Declare invariant namespaces from preserves declarations.
-        for inv_ns in self.preserve_invs:
+        # Declare invariant namespaces from preserves declarations (each
+        # once: a repeated preserves clause must not redeclare the name).
+        for inv_ns in dict.fromkeys(self.preserve_invs):
             parts.append(f"  Context ({inv_ns} : namespace).")
         # Declare ghost name for event bus tokens.
         if self.emission_tokens:
@@ -1603,21 +1622,7 @@ class IrisProof:
         for ws in _collect_while_strs_exn(self.stages):
             parts.append(_emit_while_str_lemma_exn(ws))
             parts.append("")
-        # Coq binder types: Z for int/bool, sn_val for everything else.
-        # Model types (Pydantic/dataclass) are also sn_val.
-        def _coq_type(py_type: str) -> str:
-            if py_type in ("int", "bool", "float"):
-                return "Z"
-            return "sn_val"
-        binders = "".join(
-            f" ({p} : {_coq_type(self.param_types.get(p, 'int'))})"
-            for p in self.params
-            if p not in self.list_params and p not in self.dict_params)
-        # List-typed params are split into a value binder [xs : sn_val] and
-        # its model [M_xs : list sn_val], tied by the premise xs = LitList M_xs.
-        for lp, mv in self.list_params.items():
-            binders += f" ({lp} : sn_val) ({mv} : list sn_val)"
-        parts.append(f"  Lemma {self.name}_correct{binders} :")
+        parts.append(f"  Lemma {self.name}_correct{self._render_binders()} :")
         model_premises: list[str] = [
             f"{lp} = LitList {mv}" for lp, mv in self.list_params.items()]
         if model_premises:
@@ -1737,6 +1742,8 @@ class IrisProof:
         return "\n".join(parts) + "\n"
 
     def _render_binders(self) -> str:
+        # Coq binder types: Z for int/bool, sn_val for everything else.
+        # Model types (Pydantic/dataclass) are also sn_val.
         def _coq_type(py_type: str) -> str:
             if py_type in ("int", "bool", "float"):
                 return "Z"
@@ -1745,6 +1752,8 @@ class IrisProof:
             f" ({p} : {_coq_type(self.param_types.get(p, 'int'))})"
             for p in self.params
             if p not in self.list_params and p not in self.dict_params)
+        # List-typed params are split into a value binder [xs : sn_val] and
+        # its model [M_xs : list sn_val], tied by the premise xs = LitList M_xs.
         for lp, mv in self.list_params.items():
             binders += f" ({lp} : sn_val) ({mv} : list sn_val)"
         return binders
@@ -301,14 +301,20 @@ def run_langgraph_oracle(
                 return False, _tmp_v_file.read_text() if _tmp_v_file.exists() else "", str(exc)[:500]
 
             proved = False
-            for msg in final.get("messages", []):
+            for msg in final.get("messages", ()):
                 content = str(getattr(msg, 'content', ''))
                 if "done - Qed applied" in content or "Proof complete" in content:
                     proved = True
                     break
 
-            if target_names and _tmp_v_file.exists():
+            # The agent's final file feeds both the Admitted check and the
+            # proof-script extraction; read it once.
+            try:
                 final_text = _tmp_v_file.read_text()
+            except FileNotFoundError:
+                final_text = None
+
+            if target_names and final_text is not None:
                 remaining = []
                 for name in target_names:
                     m = re.search(rf'(?:Theorem|Lemma)\s+{re.escape(name)}\b.*?Proof\.(.*?)(Qed\.|Admitted\.)', final_text, re.DOTALL)
@@ -317,11 +323,10 @@ def run_langgraph_oracle(
                 proved = proved and not remaining
 
             proof_script = ""
-            if _tmp_v_file.exists():
-                full = _tmp_v_file.read_text()
-                idx = full.rfind("Proof.")
+            if final_text is not None:
+                idx = final_text.rfind("Proof.")
                 if idx >= 0:
-                    proof_script = full[idx:].strip()
+                    proof_script = final_text[idx:].strip()
 
             # Save transcript
             import json as _json
@@ -335,7 +340,7 @@ def run_langgraph_oracle(
                     {"role": str(getattr(m, 'type', 'unknown')),
                      "content": str(getattr(m, 'content', ''))[:500],
                      "tool_calls": str(getattr(m, 'tool_calls', None))[:500] if hasattr(m, 'tool_calls') else None}
-                    for m in final.get("messages", [])
+                    for m in final.get("messages", ())
                 ],
                 "proof_script": proof_script,
             }
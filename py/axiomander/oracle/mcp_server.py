@@ -18,6 +18,7 @@ import subprocess
 import sys
 import tempfile
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -29,7 +30,7 @@ from .cache import (
     compute_cache_key,
     get_contract_hash, get_transitive_callers,
 )
-from .contract_linter import ContractLinter, AssertInfo
+from .contract_linter import ContractLinter, AssertInfo, _is_docstring_stmt
 from .purity_analyzer import (
     analyze_purity, generate_frame_conditions, generate_havoc_body,
     PurityReport,
@@ -43,6 +44,7 @@ from .reporting import (
     Action, GoalStatus, ProofLevel, PipelineReport,
     build_report, action_guidance,
 )
+from .smt_export import _find_solver
 try:
     from .client import oracle_query, interactive_oracle_query, load_config
 except ImportError:
@@ -63,6 +65,20 @@ from .evidence_graph import Evidence, EvidenceKind, ProofStatus, get_graph, save
 
 _cache = VerificationCache()
 
+# Coq imports shared by every standalone IMP proof module we hand out.
+_IMP_IMPORT_PREFIX = (
+    "From Stdlib Require Import ZArith String List Lia.\n"
+    "Require Import Imp Wp WpTactics RegMatch.\n"
+    "Import ListNotations.\n"
+    "Open Scope Z_scope.\n\n"
+)
+
+# gen-tests output keyed by (source digest, function_name, module_path), so a
+# long-running server regenerating an unchanged file skips all parsing.
+# Least recently used entries are evicted first.
+_gen_tests_cache: OrderedDict[tuple[bytes, str | None, str], str] = OrderedDict()
+_GEN_TESTS_CACHE_MAX = 256
+
 
 
 
@@ -390,12 +406,15 @@ def tool_check_file(args: dict) -> str:
     from .advisor import analyze_file
     analysis = analyze_file(source)
 
-    lines = [
+    # One pass over the functions fills both the summary table and the
+    # per-function detail sections; they are joined at the end.
+    table = [
         f"# Contract Analysis\n",
         f"**{analysis.summary}**\n",
         f"| Function | Pre | Post | Inv | Loops | Purity | Guidance |",
         f"|----------|-----|------|-----|-------|--------|----------|",
     ]
+    details = ["", "## Suggested Adornments\n"]
 
     for f in analysis.functions:
         pre = "✓" if f.has_preconditions else "—"
@@ -412,29 +431,24 @@ def tool_check_file(args: dict) -> str:
         else:
             guidance = f"{len(f.suggested_adornments)} suggestion(s)"
 
-        lines.append(f"| `{f.name}` | {pre} | {post} | {inv} | {loops} | {purity} | {guidance} |")
+        table.append(f"| `{f.name}` | {pre} | {post} | {inv} | {loops} | {purity} | {guidance} |")
 
-    lines.append("")
-    lines.append("## Suggested Adornments\n")
-
-    for f in analysis.functions:
         if f.suggested_adornments:
-            lines.append(f"### `{f.name}`")
+            details.append(f"### `{f.name}`")
             for s in f.suggested_adornments:
-                lines.append(f"- **{s.location}** (line {s.line}): `{s.suggestion}`")
+                details.append(f"- **{s.location}** (line {s.line}): `{s.suggestion}`")
                 if s.reasoning:
-                    lines.append(f"  - *{s.reasoning}*")
+                    details.append(f"  - *{s.reasoning}*")
                 if s.template:
-                    lines.append(_render_template(s.template))
-            lines.append("")
+                    details.append(_render_template(s.template))
+            details.append("")
 
         if f.existing_asserts:
-            lines.append(f"#### Existing assertions in `{f.name}`:")
-            for a in f.existing_asserts:
-                lines.append(f"- {a}")
-            lines.append("")
+            details.append(f"#### Existing assertions in `{f.name}`:")
+            details.extend(f"- {a}" for a in f.existing_asserts)
+            details.append("")
 
-    return "\n".join(lines)
+    return "\n".join(table + details)
 
 
 def _collect_smt_names(ir, name_map: dict[str, str]):
@@ -869,6 +883,13 @@ def tool_explain_cache(args: dict) -> str:
             f"Contract hash: `{contract_hash[:24]}...`\n")
 
 
+def _contract_section(title: str, items: list[str]) -> str:
+    """Render one frame-report section: heading, indented items, blank line."""
+    if not items:
+        return f"### {title}  *(none)*\n"
+    return f"### {title}\n" + "".join(f"  {item}\n" for item in items)
+
+
 def tool_frame_report(args: dict) -> str:
     """Report contracts and frame conditions for functions."""
     import ast as _ast
@@ -999,29 +1020,10 @@ def tool_frame_report(args: dict) -> str:
         lines.append(f"## `{fn.name}`")
         lines.append("")
 
-        if pres:
-            lines.append("### Preconditions")
-            for p in pres:
-                lines.append(f"  {p}")
-            lines.append("")
-        else:
-            lines.append("### Preconditions  *(none)*")
-            lines.append("")
-
-        if posts:
-            lines.append("### Postconditions")
-            for p in posts:
-                lines.append(f"  {p}")
-            lines.append("")
-        else:
-            lines.append("### Postconditions  *(none)*")
-            lines.append("")
-
+        lines.append(_contract_section("Preconditions", pres))
+        lines.append(_contract_section("Postconditions", posts))
         if invs:
-            lines.append("### Loop Invariants")
-            for inv in invs:
-                lines.append(f"  {inv}")
-            lines.append("")
+            lines.append(_contract_section("Loop Invariants", invs))
 
         lines.append("### Frame")
         t = ', '.join(params_touched) or '—'
@@ -1453,8 +1455,11 @@ def _verify_function(source: str, func_name: str, hint: str | None = None) -> Go
         )
 
     # Generate IMP via PyIR -> ImpIR (skip if module unavailable)
+    # Built once per function: the IMP lowering, the Coq renderer and the
+    # evidence record all read the same module-wide contract map.
+    contract_map = _build_contract_map(tree)
     try:
-        imp_body, imp_ir = _gen_imp_body(tree, func_node, contract_map=_build_contract_map(tree))
+        imp_body, imp_ir = _gen_imp_body(tree, func_node, contract_map=contract_map)
     except (ModuleNotFoundError, ImportError):
         return GoalStatus(name=func_name, goal_statement="",
                           level=ProofLevel.UNPROVED,
@@ -1489,6 +1494,7 @@ def _verify_function(source: str, func_name: str, hint: str | None = None) -> Go
             hint,
             ghost_vars=ghost_vars,
             imp_ir=imp_ir,
+            contract_map=contract_map,
         )
     else:
         coq_source = _generate_coq(
@@ -1499,6 +1505,7 @@ def _verify_function(source: str, func_name: str, hint: str | None = None) -> Go
             hint,
             ghost_vars=ghost_vars,
             imp_ir=imp_ir,
+            contract_map=contract_map,
         )
 
     # --- Coq-lsp oracle check ---
@@ -1507,7 +1514,8 @@ def _verify_function(source: str, func_name: str, hint: str | None = None) -> Go
     AI_PROVE_PATH.parent.mkdir(parents=True, exist_ok=True)
     import hashlib
     HASH_PATH = AI_PROVE_PATH.with_suffix(".hash")
-    generated_hash = hashlib.sha256(coq_source.encode()).hexdigest()
+    coq_bytes = coq_source.encode()
+    generated_hash = hashlib.sha256(coq_bytes).hexdigest()
     if AI_PROVE_PATH.exists():
         saved_hash = HASH_PATH.read_text().strip() if HASH_PATH.exists() else ""
         current_hash = hashlib.sha256(AI_PROVE_PATH.read_bytes()).hexdigest()
@@ -1547,7 +1555,7 @@ def _verify_function(source: str, func_name: str, hint: str | None = None) -> Go
                                 purity_note=purity_note_ai)
 
     # Write fresh coq_source for coq-lsp to fix, and save its hash
-    AI_PROVE_PATH.write_text(coq_source)
+    AI_PROVE_PATH.write_bytes(coq_bytes)
     HASH_PATH.write_text(generated_hash)
 
     # Try SMT on the remaining goals after wp_reduce
@@ -1649,7 +1657,7 @@ def _verify_function(source: str, func_name: str, hint: str | None = None) -> Go
 
             purity_note = _compute_purity_note(tree, func_node, imp_body)
 
-            _record_evidence(func_name, proof_level, method, imp_ir, _build_contract_map(tree))
+            _record_evidence(func_name, proof_level, method, imp_ir, contract_map)
 
             return GoalStatus(name=func_name,
                             goal_statement=f"wp {func_name}_body ...",
@@ -1670,7 +1678,7 @@ def _verify_function(source: str, func_name: str, hint: str | None = None) -> Go
         ce_hint = ""
         ce_dict: dict[str, int] = {}
         if result.returncode != 0:
-            from .smt_export import _expr_to_smt, _extract_vars
+            from .smt_export import _expr_to_smt, _extract_vars, _parse_smt_model
             post_irs = [r.lint_result.ir for r in lint_results 
                        if r.classification == "postcondition" and r.lint_result.ir]
             pre_irs = [r.lint_result.ir for r in lint_results
@@ -1697,19 +1705,10 @@ def _verify_function(source: str, func_name: str, hint: str | None = None) -> Go
                         if r.lint_result.ir:
                             _collect_smt_names(r.lint_result.ir, name_map)
                     ce_hint = "SMT counterexample found for postcondition:\n"
-                    for line in smt_result.stdout.splitlines():
-                        line = line.strip()
-                        if line.startswith('(define-fun') and not line.startswith('(define-fun-sort'):
-                            parts = line.split()
-                            if len(parts) >= 3:
-                                smt_name = parts[1]
-                                py_name = name_map.get(smt_name, smt_name)
-                                val = parts[-1].rstrip(')')
-                                try:
-                                    ce_dict[py_name] = int(val)
-                                    ce_hint += f"  {py_name} = {val}\n"
-                                except ValueError:
-                                    pass
+                    for smt_name, val in _parse_smt_model(smt_result.stdout).items():
+                        py_name = name_map.get(smt_name, smt_name)
+                        ce_dict[py_name] = val
+                        ce_hint += f"  {py_name} = {val}\n"
                     # Add source position of postcondition asserts that failed
                     post_asserts = [r for r in lint_results if r.classification == "postcondition"]
                     if post_asserts:
@@ -1751,7 +1750,7 @@ def _verify_function(source: str, func_name: str, hint: str | None = None) -> Go
 
         _record_evidence(func_name,
                          ProofLevel.COUNTEREXAMPLE if ce_dict else ProofLevel.UNPROVED,
-                         "", imp_ir, _build_contract_map(tree))
+                         "", imp_ir, contract_map)
 
         return GoalStatus(name=func_name,
                         goal_statement=f"wp {func_name}_body ...",
@@ -1810,12 +1809,13 @@ def _verify_function_full(source: str, func_name: str, hint: str | None = None)
 
 def _capture_residual_goal(coq_source: str, error_line: int) -> "str | None":
     """Generate a Coq fragment with Show at the error point, compile, parse goal."""
+    # coqc numbers lines by "\n" only; splitlines() would also break on
+    # \r, \f, \u2028 and friends and shift the error line.
     lines = coq_source.split("\n")
     if error_line < 1 or error_line > len(lines):
         return None
     # Keep everything up to the error line, replace error line with Show.
-    prefix = lines[: error_line - 1]
-    modified = "\n".join(prefix) + "\nShow.\n"
+    modified = "\n".join(lines[: error_line - 1] + ["Show.", ""])
     import tempfile as _tf, subprocess as _sp, os as _os
     from pathlib import Path as _Path
     BUILD_DIR_L = _Path(__file__).resolve().parent.parent.parent.parent / "_build" / "default" / "coq"
@@ -2073,10 +2073,10 @@ def _try_llm_oracle(source: str, func_name: str, goal: GoalStatus, hint: str | N
         print(f"  [oracle] LangGraph succeeded", file=_sys.stderr)
         proofs_dir = PROJECT_ROOT / ".axiomander" / "proofs"
         proofs_dir.mkdir(parents=True, exist_ok=True)
-        proof_module = preamble + "\n" + proof_script
-        (proofs_dir / f"{func_name}.v").write_text(proof_module)
+        proof_module = (preamble + "\n" + proof_script).encode()
+        (proofs_dir / f"{func_name}.v").write_bytes(proof_module)
         import time as _t
-        (proofs_dir / f"{func_name}_{int(_t.time())}.v").write_text(proof_module)
+        (proofs_dir / f"{func_name}_{int(_t.time())}.v").write_bytes(proof_module)
     else:
         goal.error_detail += f" (LangGraph: {err[:120]})"
     return goal
@@ -2103,7 +2103,8 @@ def _try_llm_oracle(source: str, func_name: str, goal: GoalStatus, hint: str | N
 
     params = [name for name, _ in _func_params(func_node)]
     expanded, _, params_coq, _, _ = _expand_params(tree, params, func_node)
-    imp_body, imp_ir = _gen_imp_body(tree, func_node, contract_map=_build_contract_map(tree))
+    contract_map = _build_contract_map(tree)
+    imp_body, imp_ir = _gen_imp_body(tree, func_node, contract_map=contract_map)
 
     # Generate full Coq source with decomposed segments (s1, s2, Q_k)
     var_types2 = _infer_var_types(func_node)
@@ -2123,7 +2124,8 @@ def _try_llm_oracle(source: str, func_name: str, goal: GoalStatus, hint: str | N
             ))
     ghost_vars_llm = _detect_ghost_vars(func_node)
     coq_source = _generate_coq(func_node, lint_results, imp_body, tree, None,
-                                ghost_vars=ghost_vars_llm, imp_ir=imp_ir)
+                                ghost_vars=ghost_vars_llm, imp_ir=imp_ir,
+                                contract_map=contract_map)
 
     # Extract the goal: the Theorem line plus the goal up to Proof
     import re
@@ -2161,13 +2163,7 @@ def _try_llm_oracle(source: str, func_name: str, goal: GoalStatus, hint: str | N
     # Use LangGraph with tool-calling: the LLM calls get_goals/try_tactic/finish_proof itself
     from axiomander.oracle.langgraph_oracle import run_langgraph_oracle
 
-    # Build preamble with imports, segmented defs, stage lemmas, goal
-    import_prefix = (
-        "From Stdlib Require Import ZArith String List Lia.\n"
-        "Require Import Imp Wp WpTactics RegMatch.\n"
-        "Import ListNotations.\n"
-        "Open Scope Z_scope.\n\n"
-    )
+    # Build preamble with imports (_IMP_IMPORT_PREFIX), segmented defs, stage lemmas, goal
 
     # Try to extract pre-generated stage lemmas from the Coq source
     # (produced by _verify_function's _build_staged_proof).  These handle
@@ -2175,7 +2171,7 @@ def _try_llm_oracle(source: str, func_name: str, goal: GoalStatus, hint: str | N
     # that the LLM struggles with.  Include them so the LLM only chains them.
     stage_lemma_text = _extract_stage_lemmas(coq_source)
 
-    preamble = import_prefix + coq_context + "\n" + stage_lemma_text + goal_text + "\nProof."
+    preamble = _IMP_IMPORT_PREFIX + coq_context + "\n" + stage_lemma_text + goal_text + "\nProof."
     ok, proof_script, err = run_langgraph_oracle(preamble)
 
     if ok:
@@ -2189,16 +2185,12 @@ def _try_llm_oracle(source: str, func_name: str, goal: GoalStatus, hint: str | N
         proofs_dir = PROJECT_ROOT / ".axiomander" / "proofs"
         proofs_dir.mkdir(parents=True, exist_ok=True)
         # Save full proof — imports + definitions (NOT staged lemmas) + new proof
-        import_prefix_save = (
-            "From Stdlib Require Import ZArith String List Lia.\n"
-            "Require Import Imp Wp WpTactics RegMatch.\n"
-            "Import ListNotations.\n"
-            "Open Scope Z_scope.\n\n"
-        )
-        proof_module = import_prefix_save + coq_context + "\n" + goal_text + "\n" + proof_script
-        (proofs_dir / f"{func_name}.v").write_text(proof_module)
+        proof_module = "".join((
+            _IMP_IMPORT_PREFIX, coq_context, "\n", goal_text, "\n", proof_script,
+        )).encode()
+        (proofs_dir / f"{func_name}.v").write_bytes(proof_module)
         import time as _time_mod
-        (proofs_dir / f"{func_name}_{int(_time_mod.time())}.v").write_text(proof_module)
+        (proofs_dir / f"{func_name}_{int(_time_mod.time())}.v").write_bytes(proof_module)
     else:
         goal.error_detail += f" (LangGraph: {err[:120]})"
     return goal
@@ -2402,11 +2394,7 @@ def _try_smt_main(pre_coq: str, post_coq: str, imp_body: str, init_state: str, n
 (assert (not (=> {pre_smt} {post_smt})))
 (check-sat)
 """
-    solver = "z3"
-    for s in ["z3", "cvc5", "cvc4"]:
-        if subprocess.run(["which", s], capture_output=True).returncode == 0:
-            solver = s
-            break
+    solver = _find_solver(("z3", "cvc5", "cvc4")) or "z3"
 
     tmp = None
     try:
@@ -2449,7 +2437,7 @@ def _smt_prove_goal(goal_texts: list[str]) -> str | None:
     from .smt_export import _expr_to_smt, _extract_vars
     import subprocess, tempfile, os
 
-    proven = []
+    smt_bodies = []
     for goal in goal_texts:
         vars_set = _extract_vars(goal)
         smt_vars = "\n".join(
@@ -2459,34 +2447,66 @@ def _smt_prove_goal(goal_texts: list[str]) -> str | None:
         goal_smt = _expr_to_smt(goal)
         if not goal_smt:
             return None
-        smt_body = f"""(set-logic QF_NIA)
+        smt_bodies.append(f"""(set-logic QF_NIA)
 {smt_vars}
 (assert (not {goal_smt}))
 (check-sat)
-"""
-        solver = "z3"
-        for s in ["z3", "cvc5", "cvc4"]:
-            if subprocess.run(["which", s], capture_output=True).returncode == 0:
-                solver = s
-                break
+""")
+    if not smt_bodies:
+        return "True"
+
+    solver = _find_solver(("z3", "cvc5", "cvc4")) or "z3"
+
+    # The goals are independent and each check is a solver subprocess, so
+    # run a few side by side.  The first goal that is not unsat settles the
+    # answer: solvers still running are killed rather than left to time out.
+    import threading
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    stop = threading.Event()
+    procs_lock = threading.Lock()
+    procs: list[subprocess.Popen] = []
+
+    def _unsat(smt_body: str) -> bool:
         tmp = None
         try:
             with tempfile.NamedTemporaryFile(mode="w", suffix=".smt2", delete=False) as f:
                 f.write(smt_body)
                 tmp = f.name
-            result = subprocess.run([solver, tmp], capture_output=True, text=True, timeout=30)
-            if "unsat" not in result.stdout:
-                return None
-            proven.append(goal)
+            with procs_lock:
+                if stop.is_set():
+                    return False
+                proc = subprocess.Popen([solver, tmp], stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE, text=True)
+                procs.append(proc)
+            try:
+                stdout, _ = proc.communicate(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                return False
+            return "unsat" in stdout
         except Exception:
-            return None
+            return False
         finally:
             if tmp:
                 try: os.unlink(tmp)
                 except: pass
-    if not proven:
-        return "True"
-    return " /\\ ".join(f"({g})" for g in proven)
+
+    pool = ThreadPoolExecutor(
+        max_workers=min(len(smt_bodies), os.cpu_count() or 1))
+    try:
+        futures = [pool.submit(_unsat, body) for body in smt_bodies]
+        for fut in as_completed(futures):
+            if not fut.result():
+                return None
+    finally:
+        with procs_lock:
+            stop.set()
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+        pool.shutdown(cancel_futures=True)
+    return " /\\ ".join(f"({g})" for g in goal_texts)
 
 
 def _try_theory_smt(
@@ -2708,31 +2728,25 @@ def _classify_assert(func_node: ast.FunctionDef, assert_node: ast.Assert) -> str
                     if all(isinstance(x, ast.Assert) for x in node.body[:i]):
                         return "invariant"
 
-    # Check if immediately before return, or part of a chain before return
-    # Walk body to find the assert
-    for i, s in enumerate(body):
-        if s is assert_node:
-            # Check forward: are all statements between here and the return asserts?
-            j = i + 1
-            while j < len(body) and isinstance(body[j], ast.Assert):
-                j += 1
-            if j < len(body) and isinstance(body[j], ast.Return):
-                return "postcondition"
-
-    # Check if at function start (only direct children of the function body)
-    seen_code = False
-    if assert_node in body:
-        idx = body.index(assert_node)
-        for i, s in enumerate(body[:idx + 1]):
-            is_doc = (isinstance(s, ast.Expr) and isinstance(s.value, ast.Constant)
-                       and isinstance(s.value.value, str))
-            if not isinstance(s, ast.Assert) and not is_doc:
-                if s is not assert_node:
-                    seen_code = True
-        if not seen_code:
-            return "precondition"
-
-    return "general"
+    # Locate the assert among the direct children of the function body once;
+    # both positional checks below work from that index.
+    idx = next((i for i, s in enumerate(body) if s is assert_node), None)
+    if idx is None:
+        return "general"
+
+    # Check if immediately before return, or part of a chain before return:
+    # are all statements between here and the return asserts?
+    j = idx + 1
+    while j < len(body) and isinstance(body[j], ast.Assert):
+        j += 1
+    if j < len(body) and isinstance(body[j], ast.Return):
+        return "postcondition"
+
+    # Check if at function start
+    for s in body[:idx]:
+        if not isinstance(s, ast.Assert) and not _is_docstring_stmt(s):
+            return "general"
+    return "precondition"
 
 
 def _used_self_fields(func_node) -> set[str]:
@@ -2938,15 +2952,18 @@ def _expand_params(tree, params, func_node: ast.FunctionDef | None = None):
     return expanded, class_fields, " ".join(parts), init_state, record_section
 
 
+# Scalar annotation names and their Coq types (all numeric-encoded).
+_PY_SCALAR_COQ = {"int": "Z", "float": "Z", "bool": "Z", "any": "Z"}
+
+
 def _py_type_to_coq(annotation) -> str:
     """Map Python type annotation AST node to a Coq type string."""
     if annotation is None:
         return "Z"
-    type_map = {"int": "Z", "float": "Z", "bool": "Z", "any": "Z"}
     if isinstance(annotation, ast.Name):
         if annotation.id == "str":
             return "list"
-        return type_map.get(annotation.id, "Z")
+        return _PY_SCALAR_COQ.get(annotation.id, "Z")
     if isinstance(annotation, ast.Subscript):
         if isinstance(annotation.value, ast.Name):
             base = annotation.value.id
@@ -2968,7 +2985,7 @@ def _py_type_to_coq(annotation) -> str:
             parts.append(n.id)
         full = ".".join(reversed(parts))
         full_lower = full.lower()
-        for name, coq in type_map.items():
+        for name, coq in _PY_SCALAR_COQ.items():
             if name in full_lower:
                 return coq
         if "str" in full_lower:
@@ -3526,6 +3543,22 @@ def _coq_safe_name(name: str) -> str:
     return name
 
 
+# Length variable names, built once per list name.  The names feed the
+# vars_found sets and SMT declarations, so interning them keeps the
+# repeated lookups to identity matches.
+_LEN_VAR_NAMES: dict[str, str] = {}
+
+
+def _len_var_name(name: str) -> str:
+    """Coq/SMT variable standing for len(name), e.g. xs -> xs__len."""
+    try:
+        return _LEN_VAR_NAMES[name]
+    except KeyError:
+        len_name = _LEN_VAR_NAMES[name] = sys.intern(
+            f"{_coq_safe_name(name)}__len")
+        return len_name
+
+
 def _coq_safe_id(name: str) -> str:
     """Sanitize a name for use as a Coq identifier (no parens, ops, etc)."""
     return name.replace("(", "_L_").replace(")", "_R_").replace(" + ", "_plus_") \
@@ -3612,7 +3645,7 @@ def _imp_aexp_to_coq_z_with_vars(aexp_str: str) -> tuple[str, set[str]]:
     if aexp_str.startswith('(ALen "'):
         end = aexp_str.index('"%string)')
         name = aexp_str[7:end]
-        safe = f"{_coq_safe_name(name)}__len"
+        safe = _len_var_name(name)
         vars_found.add(safe)
         return safe, vars_found
 
@@ -3664,7 +3697,7 @@ def _imp_aexp_to_coq_z(aexp_str: str) -> str:
     if aexp_str.startswith('(ALen "'):
         end = aexp_str.index('"%string)')
         name = aexp_str[7:end]
-        return f"{_coq_safe_name(name)}__len"
+        return _len_var_name(name)
 
     if aexp_str.startswith('(ANum '):
         end = aexp_str.index(')')
@@ -3867,7 +3900,7 @@ def _py_expr_to_coq_var(node: ast.expr) -> str:
     if isinstance(node, ast.Call):
         name = _get_call_name(node)
         if name == "len" and node.args and isinstance(node.args[0], ast.Name):
-            return f"{_coq_safe_name(node.args[0].id)}__len"
+            return _len_var_name(node.args[0].id)
     if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Sub):
         left = _py_expr_to_coq_var(node.left)
         right = _py_expr_to_coq_var(node.right)
@@ -4604,8 +4637,12 @@ def _gen_final_assign_proof(fv: list[str], q_value_conjs: list[str],
 def _render_obligations_coq(func_node, lint_results, imp_body: str,
                              full_tree=None, hint: str | None = None,
                              ghost_vars: dict[str, str] | None = None,
-                             imp_ir: object = None) -> str:
-    """Generate Coq from per-obligation theorems (AXIOMANDER_OBLIGATIONS=1 path)."""
+                             imp_ir: object = None,
+                             contract_map: dict | None = None) -> str:
+    """Generate Coq from per-obligation theorems (AXIOMANDER_OBLIGATIONS=1 path).
+
+    Pass the module's ``contract_map`` when the caller already built it.
+    """
     import ast as _ast
     from .obligation_gen import generate_obligations
 
@@ -4686,7 +4723,8 @@ def _render_obligations_coq(func_node, lint_results, imp_body: str,
             # truncated mid-string.  Just show the line and classification.
             source_notes += f"(* line {r.lineno}: [{r.classification}] *)\n"
 
-    contract_map = _build_contract_map(full_tree) if full_tree else {}
+    if contract_map is None:
+        contract_map = _build_contract_map(full_tree) if full_tree else {}
 
     obligations = generate_obligations(
         func_node, imp_ir, contract_map, params,
@@ -4794,8 +4832,12 @@ Definition {name}_body : com :=
 """
 
 
-def _generate_coq(func_node, lint_results, imp_body: str, full_tree=None, hint: str | None = None, ghost_vars: dict[str, str] | None = None, imp_ir: object = None) -> str:
-    """Generate Coq theorem file for a function."""
+def _generate_coq(func_node, lint_results, imp_body: str, full_tree=None, hint: str | None = None, ghost_vars: dict[str, str] | None = None, imp_ir: object = None, contract_map: dict | None = None) -> str:
+    """Generate Coq theorem file for a function.
+
+    Pass the module's ``contract_map`` when the caller already built it;
+    otherwise it is built (once) from ``full_tree``.
+    """
     import ast
 
     name = func_node.name
@@ -5106,9 +5148,10 @@ Theorem {name}_vcg_exit : forall {vcg_params},
     purity_report: "PurityReport | None" = None
     frame_comment = ""
     if full_tree is not None:
-        contract_map_coq = _build_contract_map(full_tree)
+        if contract_map is None:
+            contract_map = _build_contract_map(full_tree)
         purity_report = analyze_purity(
-            func_node, full_tree, contract_map_coq, class_fields,
+            func_node, full_tree, contract_map, class_fields,
         )
         if not purity_report.is_pure:
             imp_body = generate_havoc_body(imp_body, purity_report)
@@ -5196,6 +5239,7 @@ Theorem {name}_vcg_exit : forall {vcg_params},
     # --- Per-callee frame lemmas ---
     frame_lemmas = ""
     frame_applies = ""
+    ccalls: list = []
     if imp_ir is not None:
         from axiomander.oracle.imp_ir import ImpCCall
 
@@ -5218,23 +5262,26 @@ Theorem {name}_vcg_exit : forall {vcg_params},
         if ghost_vars:
             all_frame_vars |= set(ghost_vars.keys())
 
-        # Names to avoid in lemma parameters
-        used_names = set(params) | {c.target for c in _collect_ccalls(imp_ir)}
+        # One walk of the IR feeds every per-CCall use below.
+        ccalls = _collect_ccalls(imp_ir)
+
+        # Names to avoid in lemma parameters; and, per callee, the distinct
+        # targets it is called with (callees called multiple times with
+        # different targets need target-qualified lemma names).
+        used_names = set(params)
         if ghost_vars:
             used_names |= set(ghost_vars.keys())
-        for c in _collect_ccalls(imp_ir):
-            used_names |= set(c.writes)
+        callee_targets: dict[str, set[str]] = {}
+        for c in ccalls:
+            used_names.add(c.target)
+            used_names.update(c.writes)
+            callee_targets.setdefault(c.name, set()).add(c.target)
+        multi_call_callees = {c for c, ts in callee_targets.items() if len(ts) > 1}
         s_name = "s" if "s" not in used_names else next(f"s{i}" for i in range(10) if f"s{i}" not in used_names)
         r_name = "r" if "r" not in used_names else next(f"r{i}" for i in range(10) if f"r{i}" not in used_names)
 
         seen_lemmas: set[tuple[str, str, str, str]] = set()
-        # Detect callees called multiple times (different targets)
-        callee_targets: dict[str, list[str]] = {}
-        for ccall in _collect_ccalls(imp_ir):
-            callee_targets.setdefault(ccall.name, []).append(ccall.target)
-        multi_call_callees = {c for c, ts in callee_targets.items() if len(set(ts)) > 1}
-
-        for ccall in _collect_ccalls(imp_ir):
+        for ccall in ccalls:
             target = ccall.target
             writes = set(ccall.writes)
             callee = ccall.name
@@ -5270,9 +5317,7 @@ Theorem {name}_vcg_exit : forall {vcg_params},
     staged_lemma_text = ""
     staged_proof_body = ""
     staged_body_composition = ""
-    if (imp_ir is not None and full_tree is not None
-            and len(_collect_ccalls(imp_ir)) >= 1):
-        ccalls = _collect_ccalls(imp_ir)
+    if imp_ir is not None and full_tree is not None and ccalls:
         has_initial = _has_initial_assignments(imp_ir, ccalls)
         has_non_int = any(
             _is_string_param(a) or _is_list_param(a) or _is_dict_param(a) or _is_float_param(a)
@@ -5284,10 +5329,11 @@ Theorem {name}_vcg_exit : forall {vcg_params},
             if ghost_vars:
                 for g, init_expr in ghost_vars.items():
                     extended_init = f'(upd {extended_init} "{g}"%string (VZ {init_expr}))'
-            contract_map_staged = _build_contract_map(full_tree)
+            if contract_map is None:
+                contract_map = _build_contract_map(full_tree)
             try:
                 staged_defs, staged_lemma_text, staged_proof_body, staged_body_composition = _build_staged_proof(
-                    imp_ir, contract_map_staged, params, ghost_vars or {},
+                    imp_ir, contract_map, params, ghost_vars or {},
                     extended_init, pre_coq, post_coq, name,
                 )
             except Exception:
@@ -5644,20 +5690,31 @@ def tool_gen_tests(args: dict) -> str:
     """Generate Hypothesis property tests from assert contracts.
 
     Args:
-        source (str): Python source code.
+        source (str | bytes): Python source code (raw bytes from the CLI).
         function_name (str, optional): Generate tests only for this function.
         module_path (str, optional): Source file path (used in import line).
 
     Returns:
         str: A complete pytest + Hypothesis test module as a string.
     """
+    import hashlib
     from .property_test_gen import generate_tests
     source = args.get("source", "")
     func_name = args.get("function_name") or None
     module_path = args.get("module_path", "")
     if not source:
         return "Error: source is required"
-    return generate_tests(source, func_name=func_name, module_path=module_path)
+    raw = source.encode() if isinstance(source, str) else source
+    key = (hashlib.blake2b(raw, digest_size=16).digest(), func_name, module_path)
+    cached = _gen_tests_cache.get(key)
+    if cached is not None:
+        _gen_tests_cache.move_to_end(key)
+        return cached
+    result = generate_tests(source, func_name=func_name, module_path=module_path)
+    _gen_tests_cache[key] = result
+    if len(_gen_tests_cache) > _GEN_TESTS_CACHE_MAX:
+        _gen_tests_cache.popitem(last=False)
+    return result
 
 
 def tool_iris_verify(args: dict) -> str:
@@ -5667,6 +5724,7 @@ def tool_iris_verify(args: dict) -> str:
         source (str): Python source code.
         function_name (str, optional): Verify only this function.
         json (bool, optional): Output JSON report (default: human-readable).
+        jobs (int, optional): Worker processes for whole-file runs (default: 1).
 
     Returns:
         str: Verification report as JSON or human-readable text.
@@ -5677,6 +5735,7 @@ def tool_iris_verify(args: dict) -> str:
     source = args.get("source", "")
     func_name = args.get("function_name") or None
     as_json = args.get("json", False)
+    jobs = int(args.get("jobs", 1) or 1)
 
     if not source:
         return "Error: source is required"
@@ -5697,7 +5756,7 @@ def tool_iris_verify(args: dict) -> str:
             f.write(source)
             tf = f.name
         try:
-            report = run_iris_pipeline(tf, {}, quiet=True)
+            report = run_iris_pipeline(tf, {}, quiet=True, jobs=jobs)
         finally:
             os.unlink(tf)
 
@@ -5945,7 +6004,8 @@ def _cli(argv: list[str] | None = None):
         output: Optional[str] = typer.Option(None, "--output", "-o", help="Write output to this file instead of stdout"),
     ):
         """Generate Hypothesis property tests from assert contracts."""
-        opts: dict = {"source": _Path(file).read_text(), "module_path": file}
+        # Raw bytes: the parser decodes once, no str round-trip.
+        opts: dict = {"source": _Path(file).read_bytes(), "module_path": file}
         if function:
             opts["function_name"] = function
         result = tool_gen_tests(opts)
@@ -5961,10 +6021,11 @@ def _cli(argv: list[str] | None = None):
         function: Optional[str] = typer.Option(None, "--function", "-f", help="Verify only this function"),
         json_flag: bool = typer.Option(False, "--json", help="Output JSON report"),
         quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress per-function status"),
+        jobs: int = typer.Option(1, "--jobs", "-j", help="Verify functions in N worker processes"),
     ):
         """Verify Python functions with the Iris backend."""
         source = _Path(file).read_text()
-        opts: dict = {"source": source, "json": json_flag}
+        opts: dict = {"source": source, "json": json_flag, "jobs": jobs}
         if function:
             opts["function_name"] = function
         result = tool_iris_verify(opts)
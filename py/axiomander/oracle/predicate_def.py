@@ -166,16 +166,15 @@ def _extract_base_value(func_node: ast.FunctionDef, predicate_name: str) -> str:
 
 
 def _is_recursive_expr(node: ast.AST, name: str) -> bool:
-    """Check if an AST subtree contains a self-call to *name*."""
-    class Checker(ast.NodeVisitor):
-        found = False
-        def visit_Call(self, n):
-            if isinstance(n.func, ast.Name) and n.func.id == name:
-                self.found = True
-            self.generic_visit(n)
-    c = Checker()
-    c.visit(node)
-    return c.found
+    """Check if an AST subtree contains a self-call to *name*.
+
+    Stops at the first self-call instead of visiting the whole subtree.
+    """
+    return any(
+        isinstance(n, ast.Call) and isinstance(n.func, ast.Name)
+        and n.func.id == name
+        for n in ast.walk(node)
+    )
 
 
 def _find_decreases_annotation(func_node: ast.FunctionDef) -> str | None:
@@ -34,7 +34,7 @@ from .contract_ir import (
     Expr, BinOp, Logical, IntLit, Var, LenExpr, ImpliesExpr,
     RaisesExpr, IsShape, IsValid, ReMatchExpr,
 )
-from .contract_linter import ContractLinter
+from .contract_linter import ContractLinter, _is_docstring_stmt
 
 
 # ---------------------------------------------------------------------------
@@ -113,24 +113,18 @@ class FunctionContracts:
 # Contract extraction
 # ---------------------------------------------------------------------------
 
+# Annotation name -> strategy type string.  Anything else, including a
+# named class (field-based objects are generated separately), is "int".
+_STRATEGY_TYPES = {"int": "int", "float": "float", "str": "str",
+                   "bool": "bool", "list": "list", "List": "list"}
+
+
 def _type_from_annotation(ann: Optional[ast.expr]) -> str:
     """Map a Python type annotation AST node to a strategy type string."""
     if ann is None:
         return "int"
     if isinstance(ann, ast.Name):
-        name = ann.id
-        if name in ("int",):
-            return "int"
-        if name in ("float",):
-            return "float"
-        if name in ("str",):
-            return "str"
-        if name in ("bool",):
-            return "bool"
-        if name in ("list", "List"):
-            return "list"
-        # Named class -- treat as int (field-based objects generated separately)
-        return "int"
+        return _STRATEGY_TYPES.get(ann.id, "int")
     if isinstance(ann, ast.Subscript):
         # list[int], List[int], etc.
         if isinstance(ann.value, ast.Name) and ann.value.id in ("list", "List"):
@@ -167,32 +161,28 @@ def _collect_old_bindings(assert_nodes: list[ast.Assert]) -> dict[str, str]:
 def _classify_assert_simple(func_node: ast.FunctionDef, stmt: ast.Assert) -> str:
     """Lightweight classification: precondition / postcondition / general."""
     body = func_node.body
+    idx = next((i for i, s in enumerate(body) if s is stmt), None)
+    if idx is None:
+        return "general"
     # Postcondition: assert immediately before return (or chain of asserts before return)
-    for i, s in enumerate(body):
-        if s is stmt:
-            j = i + 1
-            while j < len(body) and isinstance(body[j], ast.Assert):
-                j += 1
-            if j < len(body) and isinstance(body[j], ast.Return):
-                return "postcondition"
+    j = idx + 1
+    while j < len(body) and isinstance(body[j], ast.Assert):
+        j += 1
+    if j < len(body) and isinstance(body[j], ast.Return):
+        return "postcondition"
     # Precondition: at function start, before any non-assert code
-    seen_code = False
-    if stmt in body:
-        idx = body.index(stmt)
-        for s in body[:idx + 1]:
-            is_doc = (isinstance(s, ast.Expr) and isinstance(s.value, ast.Constant)
-                      and isinstance(s.value.value, str))
-            if not isinstance(s, ast.Assert) and not is_doc:
-                if s is not stmt:
-                    seen_code = True
-        if not seen_code:
-            return "precondition"
-    return "general"
-
-
-def extract_function_contracts(source: str, func_name: str) -> FunctionContracts:
+    for s in body[:idx]:
+        if not isinstance(s, ast.Assert) and not _is_docstring_stmt(s):
+            return "general"
+    return "precondition"
+
+
+def extract_function_contracts(source: str | bytes, func_name: str) -> FunctionContracts:
     """Parse a Python source string and extract contracts for func_name.
 
+    ``source`` may be raw file bytes; ``ast.parse`` decodes them itself
+    (honouring any PEP 263 coding cookie).
+
     Returns a FunctionContracts with pre/post IR nodes and old() bindings.
     """
     try:
@@ -209,6 +199,12 @@ def extract_function_contracts(source: str, func_name: str) -> FunctionContracts
 
     if func_node is None:
         return FunctionContracts(func_name=func_name)
+    return _contracts_from_node(func_node)
+
+
+def _contracts_from_node(func_node: ast.FunctionDef) -> FunctionContracts:
+    """Extract contracts from an already-parsed function node."""
+    func_name = func_node.name
 
     # Collect parameter names and types
     params: list[str] = []
@@ -239,7 +235,7 @@ def extract_function_contracts(source: str, func_name: str) -> FunctionContracts
     preconditions: list[Expr] = []
     precond_sources: list[str] = []
     for stmt in pre_asserts:
-        result = linter_pre.lint_expression(stmt.test)
+        result = linter_pre.lint_expression(stmt.test, translate=False)
         if result.ir is not None:
             preconditions.append(result.ir)
             precond_sources.append(ast.unparse(stmt.test))
@@ -248,7 +244,7 @@ def extract_function_contracts(source: str, func_name: str) -> FunctionContracts
     postcond_sources: list[str] = []
     exception_postconditions: list[RaisesExpr] = []
     for stmt in post_asserts:
-        result = linter_post.lint_expression(stmt.test)
+        result = linter_post.lint_expression(stmt.test, translate=False)
         if result.ir is not None:
             if isinstance(result.ir, RaisesExpr):
                 exception_postconditions.append(result.ir)
@@ -501,16 +497,18 @@ def _render_test_function(
         contracts.preconditions,
     )
 
-    # Separate free params (passed to @given) from derived params
-    free_params = [p for p in contracts.params if strategies[p].derived_from is None]
-    derived_params = [p for p in contracts.params if strategies[p].derived_from is not None]
+    # Separate free params (passed to @given) from derived params in a
+    # single pass, keeping the strategy alongside each name.
+    free: list[tuple[str, ParamStrategy]] = []
+    derived: list[tuple[str, ParamStrategy]] = []
+    for p in contracts.params:
+        s = strategies[p]
+        (free if s.derived_from is None else derived).append((p, s))
+    free_params = [p for p, _ in free]
 
-    # Build @given decorator
-    given_args = ", ".join(
-        f"{p}={strategies[p].to_hypothesis()}"
-        for p in free_params
-        if strategies[p].to_hypothesis()
-    )
+    # Build @given decorator; each strategy expression is rendered once.
+    rendered = [(p, s.to_hypothesis()) for p, s in free]
+    given_args = ", ".join(f"{p}={h}" for p, h in rendered if h)
     decorator = f"@given({given_args})"
 
     # Build function signature (free params only -- derived are computed inside)
@@ -520,8 +518,7 @@ def _render_test_function(
     body_lines: list[str] = []
 
     # Derived param bindings
-    for p in derived_params:
-        s = strategies[p]
+    for p, s in derived:
         body_lines.append(f"    {p} = {s.derived_expr}")
 
     # old() snapshot
@@ -557,8 +554,29 @@ def _render_test_function(
     return "\n".join(lines)
 
 
+# Static preamble of every generated test module; only the source path and
+# the import line vary, so the whole header is one template format.
+_TEST_MODULE_HEADER = '''\
+"""
+Auto-generated property tests from assert contracts.
+Source: {source}
+
+Generated by: axiomander gen-tests
+Do not edit -- regenerate with: axiomander gen-tests <file>
+"""
+
+import pytest
+from hypothesis import given, assume, settings
+from hypothesis import strategies as st
+
+from axiomander.oracle.contract_runtime import implies, is_shape, is_valid, re_match_pred, _OldSnapshot
+{import_line}
+
+'''
+
+
 def generate_tests(
-    source: str,
+    source: str | bytes,
     func_name: Optional[str] = None,
     module_path: str = "",
 ) -> str:
@@ -568,6 +586,7 @@ def generate_tests(
     ----------
     source:
         Python source code containing functions with assert contracts.
+        Raw file bytes are accepted and handed to the parser undecoded.
     func_name:
         If given, generate tests only for this function.
         If None, generate tests for all functions that have contracts.
@@ -584,12 +603,17 @@ def generate_tests(
     except SyntaxError as exc:
         return f"# axiomander: could not parse source -- {exc}\n"
 
-    # Collect function names to process
-    func_names: list[str] = []
+    # Collect function names to process.  A name can occur more than once
+    # (redefinitions, same-named methods); emit each import / test once.
+    # The first definition of each name is the one extracted, matching
+    # extract_function_contracts; contracts come straight from these nodes
+    # so the module is parsed once, not once per function.
+    func_nodes: dict[str, ast.FunctionDef] = {}
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             if func_name is None or node.name == func_name:
-                func_names.append(node.name)
+                func_nodes.setdefault(node.name, node)  # type: ignore[arg-type]
+    func_names = list(func_nodes)
 
     if not func_names:
         return f"# axiomander: no functions found\n"
@@ -602,30 +626,18 @@ def generate_tests(
     else:
         import_line = f"# from <module> import {', '.join(func_names)}"
 
-    # Build header
-    header_lines = [
-        '"""',
-        "Auto-generated property tests from assert contracts.",
-        f"Source: {module_path or '<unknown>'}",
-        "",
-        "Generated by: axiomander gen-tests",
-        "Do not edit -- regenerate with: axiomander gen-tests <file>",
-        '"""',
-        "",
-        "import pytest",
-        "from hypothesis import given, assume, settings",
-        "from hypothesis import strategies as st",
-        "",
-        "from axiomander.oracle.contract_runtime import implies, is_shape, is_valid, re_match_pred, _OldSnapshot",
-        import_line,
-        "",
-        "",
-    ]
+    header = _TEST_MODULE_HEADER.format(
+        source=module_path or "<unknown>", import_line=import_line
+    )
 
     # Generate one test function per source function
     test_blocks: list[str] = []
-    for fn in func_names:
-        contracts = extract_function_contracts(source, fn)
+    for fn, node in func_nodes.items():
+        # Functions with no assert at all cannot yield contracts.
+        if not any(isinstance(n, ast.Assert) for n in ast.walk(node)):
+            contracts = FunctionContracts(func_name=fn)
+        else:
+            contracts = _contracts_from_node(node)
         if not contracts.postconditions and not contracts.exception_postconditions:
             # No postconditions -- emit a placeholder
             test_blocks.append(
@@ -635,13 +647,28 @@ def generate_tests(
         block = _render_test_function(contracts, import_line)
         test_blocks.append(block + "\n")
 
-    return "\n".join(header_lines) + "\n\n".join(test_blocks)
+    return header + "\n\n".join(test_blocks)
 
 
 # ---------------------------------------------------------------------------
 # Level C: counterexample -> regression test
 # ---------------------------------------------------------------------------
 
+# Fixed stanzas of a regression test; only the names vary per counterexample.
+_REGRESSION_HEAD_TEMPLATE = (
+    "def test_{func_name}_regression_counterexample():\n"
+    '    """Regression test: SMT counterexample found by axiomander.\n'
+)
+_REGRESSION_CALL_TEMPLATE = (
+    "    # This call should expose the contract violation:\n"
+    "    result = {func_name}({call_args})\n"
+)
+_REGRESSION_VIOLATED_TEMPLATE = (
+    "    # Postcondition that was violated: {postcond_src}\n"
+    "    # TODO: assert the correct behaviour here\n"
+)
+
+
 def counterexample_to_test(
     func_name: str,
     params: list[str],
@@ -666,26 +693,21 @@ def counterexample_to_test(
     str
         A ``def test_<func>_regression_counterexample():`` function body.
     """
-    lines = [
-        f"def test_{func_name}_regression_counterexample():",
-        f'    """Regression test: SMT counterexample found by axiomander.',
-    ]
+    parts = [_REGRESSION_HEAD_TEMPLATE.format(func_name=func_name)]
     if postcond_src:
-        lines.append(f"    Violated postcondition: {postcond_src}")
-    lines.append('    """')
+        parts.append(f"    Violated postcondition: {postcond_src}\n")
+    parts.append('    """\n')
 
     # Emit concrete input bindings
     for p in params:
         if p in counterexample:
-            lines.append(f"    {p} = {counterexample[p]}")
+            parts.append(f"    {p} = {counterexample[p]}\n")
         else:
-            lines.append(f"    {p} = 0  # not in counterexample model")
+            parts.append(f"    {p} = 0  # not in counterexample model\n")
 
-    call_args = ", ".join(params)
-    lines.append(f"    # This call should expose the contract violation:")
-    lines.append(f"    result = {func_name}({call_args})")
+    parts.append(_REGRESSION_CALL_TEMPLATE.format(
+        func_name=func_name, call_args=", ".join(params)
+    ))
     if postcond_src:
-        lines.append(f"    # Postcondition that was violated: {postcond_src}")
-        lines.append(f"    # TODO: assert the correct behaviour here")
-    lines.append("")
-    return "\n".join(lines)
+        parts.append(_REGRESSION_VIOLATED_TEMPLATE.format(postcond_src=postcond_src))
+    return "".join(parts)
@@ -54,10 +54,11 @@ def analyze_purity(
     if func_node.args.vararg:
         param_names.add(func_node.args.vararg.arg)
 
+    assert_nodes = _assert_node_ids(func_node)
     for stmt in ast.walk(func_node):
         # Calls inside assert statements are contracts, not body code — skip
         if isinstance(stmt, ast.Call):
-            if _is_inside_assert(stmt, func_node):
+            if id(stmt) in assert_nodes:
                 continue
             call_name = _get_call_name(stmt)
             if call_name:
@@ -137,8 +138,11 @@ def generate_frame_conditions(
     if func_node.args.vararg:
         param_names.add(func_node.args.vararg.arg)
 
-    # Collect all fields mentioned in user asserts (pre, post, invariant, general)
+    # One walk over the function collects both the fields mentioned in user
+    # asserts (pre, post, invariant, general) and the fields that are
+    # mutated (assigned, aug-assigned) in the function body.
     mentioned_fields: set[tuple[str, str]] = set()
+    mutated_fields: set[tuple[str, str]] = set()
     for stmt in ast.walk(func_node):
         if isinstance(stmt, ast.Assert):
             for node in ast.walk(stmt):
@@ -146,19 +150,13 @@ def generate_frame_conditions(
                     base = _get_attribute_base(node)
                     if base in param_names:
                         mentioned_fields.add((base, node.attr))
-                if isinstance(node, ast.Name) and node.id.endswith("_old"):
-                    pass
-
-    # Collect fields that are mutated (assigned, aug-assigned) in the function body
-    mutated_fields: set[tuple[str, str]] = set()
-    for stmt in ast.walk(func_node):
-        if isinstance(stmt, ast.Assign):
+        elif isinstance(stmt, ast.Assign):
             for target in stmt.targets:
                 if isinstance(target, ast.Attribute):
                     base = _get_attribute_base(target)
                     if base in param_names:
                         mutated_fields.add((base, target.attr))
-        if isinstance(stmt, ast.AugAssign):
+        elif isinstance(stmt, ast.AugAssign):
             if isinstance(stmt.target, ast.Attribute):
                 base = _get_attribute_base(stmt.target)
                 if base in param_names:
@@ -217,15 +215,17 @@ def generate_havoc_body(imp_body: str, report: PurityReport) -> str:
     return f"(CSeq {imp_body} (CHavoc [{havocs}]))"
 
 
-def _is_inside_assert(node: ast.AST, root: ast.FunctionDef) -> bool:
-    """Check whether an AST node is inside an assert statement (contract)."""
-    for parent in ast.walk(root):
-        if isinstance(parent, ast.Assert) and node in ast.walk(parent):
-            # Only return True if the assert is the closest ancestor
-            for inner in ast.walk(parent):
-                if inner is node:
-                    return True
-    return False
+def _assert_node_ids(root: ast.FunctionDef) -> set[int]:
+    """Ids of every AST node inside an assert statement (contract) of *root*.
+
+    Computed once per function so the membership test per call node is O(1)
+    instead of re-walking every assert subtree.
+    """
+    return {
+        id(inner)
+        for parent in ast.walk(root) if isinstance(parent, ast.Assert)
+        for inner in ast.walk(parent)
+    }
 
 
 def _get_call_name(node: ast.Call) -> str | None:
@@ -10,6 +10,24 @@ from typing import Optional
 from .py_ir import *
 
 
+# PyConstant.py_type by the exact type of an ast.Constant value; the parser
+# only produces builtin types, so one dict lookup replaces an isinstance
+# chain.  Anything else (int, complex, bytes, ...) is labelled "int".
+_CONSTANT_PY_TYPES = {bool: "bool", str: "str", float: "float",
+                      type(None): "None"}
+
+# ast operator class -> PyIR operator string.  Module-level so the ast.*
+# attribute lookups and dict build happen once, not per translated node.
+_BINOP_OPS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*",
+              ast.Div: "/", ast.FloorDiv: "//", ast.Mod: "%"}
+_COMPARE_OPS = {ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=",
+                ast.Eq: "==", ast.NotEq: "!=", ast.Is: "is",
+                ast.IsNot: "is not", ast.In: "in", ast.NotIn: "not in"}
+_BOOLOP_OPS = {ast.And: "and", ast.Or: "or"}
+_UNARY_OPS = {ast.USub: "-", ast.Not: "not"}
+_AUGASSIGN_OPS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/"}
+
+
 class PyIRTranslator:
     """Walk a Python AST and produce PyIR nodes."""
 
@@ -17,109 +35,99 @@ class PyIRTranslator:
         self._linter = contract_linter  # ContractLinter for invariant extraction
 
     def translate_expr(self, node: ast.expr) -> Optional[PyExpr]:
-        if isinstance(node, ast.Name):
-            return PyName(name=node.id)
-        if isinstance(node, ast.Constant):
-            py_type = "int"
-            if isinstance(node.value, bool):
-                py_type = "bool"
-            elif isinstance(node.value, str):
-                py_type = "str"
-            elif isinstance(node.value, float):
-                py_type = "float"
-            elif node.value is None:
-                py_type = "None"
-            return PyConstant(value=node.value, py_type=py_type)
-        if isinstance(node, ast.BinOp):
-            op_map = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*",
-                      ast.Div: "/", ast.FloorDiv: "//", ast.Mod: "%"}
-            op = op_map.get(type(node.op))
-            if op is None:
-                return None
-            left = self.translate_expr(node.left)
-            right = self.translate_expr(node.right)
-            if left and right:
-                return PyBinaryOp(op=op, left=left, right=right)
-        if isinstance(node, ast.Compare):
-            op_map = {ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=",
-                      ast.Eq: "==", ast.NotEq: "!=", ast.Is: "is",
-                      ast.IsNot: "is not", ast.In: "in", ast.NotIn: "not in"}
-            if len(node.ops) == 1:
-                op = op_map.get(type(node.ops[0]))
-                if op:
-                    left = self.translate_expr(node.left)
-                    right = self.translate_expr(node.comparators[0])
-                    if left and right:
-                        return PyCompare(op=op, left=left, right=right)
-        if isinstance(node, ast.BoolOp):
-            op_map = {ast.And: "and", ast.Or: "or"}
-            op = op_map.get(type(node.op))
-            if op:
-                operands = [self.translate_expr(v) for v in node.values]
-                operands = [o for o in operands if o]
-                if operands:
-                    return PyBooleanOp(op=op, operands=operands)
-        if isinstance(node, ast.UnaryOp):
-            op_map = {ast.USub: "-", ast.Not: "not"}
-            op = op_map.get(type(node.op))
+        handler = _EXPR_TRANSLATIONS.get(type(node))
+        return handler(self, node) if handler is not None else None
+
+    def _translate_name(self, node: ast.Name) -> PyExpr:
+        return PyName(name=node.id)
+
+    def _translate_constant(self, node: ast.Constant) -> PyExpr:
+        py_type = _CONSTANT_PY_TYPES.get(type(node.value), "int")
+        return PyConstant(value=node.value, py_type=py_type)
+
+    def _translate_binop(self, node: ast.BinOp) -> Optional[PyExpr]:
+        op = _BINOP_OPS.get(type(node.op))
+        if op is None:
+            return None
+        left = self.translate_expr(node.left)
+        right = self.translate_expr(node.right)
+        if left and right:
+            return PyBinaryOp(op=op, left=left, right=right)
+        return None
+
+    def _translate_compare(self, node: ast.Compare) -> Optional[PyExpr]:
+        if len(node.ops) == 1:
+            op = _COMPARE_OPS.get(type(node.ops[0]))
             if op:
-                operand = self.translate_expr(node.operand)
-                if operand:
-                    return PyUnaryOp(op=op, operand=operand)
-        if isinstance(node, ast.Call):
-            name = self._call_name(node)
-            if name is None:
-                return None
-            args = [self.translate_expr(a) for a in node.args]
-            args = [a for a in args if a is not None]
-            keywords = {}
-            for kw in node.keywords:
-                if kw.arg and kw.value:
-                    val = self.translate_expr(kw.value)
-                    if val:
-                        keywords[kw.arg] = val
-            is_method = isinstance(node.func, ast.Attribute)
-            return PyCall(func=name, args=args, is_method=is_method, keywords=keywords)
-        if isinstance(node, ast.Subscript):
-            container = self.translate_expr(node.value)
-            if isinstance(node.slice, ast.Slice):
-                start = self.translate_expr(node.slice.lower) if node.slice.lower else None
-                end = self.translate_expr(node.slice.upper) if node.slice.upper else None
-                if container:
-                    return PySliceSubscript(obj=container, start=start, end=end)
-            key = self.translate_expr(node.slice)
-            if container and key:
-                return PySubscript(container=container, key=key)
-        if isinstance(node, ast.Attribute):
-            obj = self.translate_expr(node.value)
-            if obj:
-                return PyAttribute(obj=obj, attr=node.attr)
-        if isinstance(node, ast.List):
-            elements = [self.translate_expr(e) for e in node.elts]
-            elements = [e for e in elements if e is not None]
-            return PyListLiteral(elements=elements)
-        if isinstance(node, ast.Dict):
-            pairs = []
-            for k, v in zip(node.keys, node.values):
-                ke = self.translate_expr(k) if k else None
-                ve = self.translate_expr(v)
-                if ve:
-                    pairs.append({"key": ke, "value": ve})
-            return PyDictLiteral(pairs=pairs)
-        if isinstance(node, ast.Set):
-            elements = [self.translate_expr(e) for e in node.elts]
-            elements = [e for e in elements if e is not None]
-            return PySetLiteral(elements=elements)
-        if isinstance(node, ast.Tuple):
-            elements = [self.translate_expr(e) for e in node.elts]
-            elements = [e for e in elements if e is not None]
-            return PyTupleLiteral(elements=elements)
-        if isinstance(node, ast.ListComp):
-            return self._translate_list_comp(node)
-        if isinstance(node, ast.GeneratorExp):
-            return self._translate_generator(node)
+                left = self.translate_expr(node.left)
+                right = self.translate_expr(node.comparators[0])
+                if left and right:
+                    return PyCompare(op=op, left=left, right=right)
+        return None
+
+    def _translate_boolop(self, node: ast.BoolOp) -> Optional[PyExpr]:
+        op = _BOOLOP_OPS.get(type(node.op))
+        if op:
+            operands = [self.translate_expr(v) for v in node.values]
+            operands = [o for o in operands if o]
+            if operands:
+                return PyBooleanOp(op=op, operands=operands)
         return None
 
+    def _translate_unaryop(self, node: ast.UnaryOp) -> Optional[PyExpr]:
+        op = _UNARY_OPS.get(type(node.op))
+        if op:
+            operand = self.translate_expr(node.operand)
+            if operand:
+                return PyUnaryOp(op=op, operand=operand)
+        return None
+
+    def _translate_call(self, node: ast.Call) -> Optional[PyExpr]:
+        name = self._call_name(node)
+        if name is None:
+            return None
+        args = [self.translate_expr(a) for a in node.args]
+        args = [a for a in args if a is not None]
+        keywords = {}
+        for kw in node.keywords:
+            if kw.arg and kw.value:
+                val = self.translate_expr(kw.value)
+                if val:
+                    keywords[kw.arg] = val
+        is_method = isinstance(node.func, ast.Attribute)
+        return PyCall(func=name, args=args, is_method=is_method, keywords=keywords)
+
+    def _translate_subscript(self, node: ast.Subscript) -> Optional[PyExpr]:
+        container = self.translate_expr(node.value)
+        if isinstance(node.slice, ast.Slice):
+            start = self.translate_expr(node.slice.lower) if node.slice.lower else None
+            end = self.translate_expr(node.slice.upper) if node.slice.upper else None
+            if container:
+                return PySliceSubscript(obj=container, start=start, end=end)
+        key = self.translate_expr(node.slice)
+        if container and key:
+            return PySubscript(container=container, key=key)
+        return None
+
+    def _translate_attribute(self, node: ast.Attribute) -> Optional[PyExpr]:
+        obj = self.translate_expr(node.value)
+        if obj:
+            return PyAttribute(obj=obj, attr=node.attr)
+        return None
+
+    def _translate_elements(self, node) -> list[PyExpr]:
+        elements = [self.translate_expr(e) for e in node.elts]
+        return [e for e in elements if e is not None]
+
+    def _translate_dict(self, node: ast.Dict) -> PyExpr:
+        pairs = []
+        for k, v in zip(node.keys, node.values):
+            ke = self.translate_expr(k) if k else None
+            ve = self.translate_expr(v)
+            if ve:
+                pairs.append({"key": ke, "value": ve})
+        return PyDictLiteral(pairs=pairs)
+
     def translate_stmt(self, node: ast.stmt) -> Optional[PyStmt]:
         if isinstance(node, ast.Assign):
             val = self.translate_expr(node.value)
@@ -142,8 +150,7 @@ class PyIRTranslator:
                         if isinstance(target.value, ast.Name):
                             return PyStoreAttr(obj=target.value.id, attr=target.attr, value=val)
         if isinstance(node, ast.AugAssign):
-            op_map = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/"}
-            op = op_map.get(type(node.op))
+            op = _AUGASSIGN_OPS.get(type(node.op))
             val = self.translate_expr(node.value)
             if op and val:
                 if isinstance(node.target, ast.Name):
@@ -301,9 +308,31 @@ class PyIRTranslator:
         for stmt in body:
             if not isinstance(stmt, ast.Assert):
                 break
-            lr = self._linter.lint_expression(stmt.test)
+            lr = self._linter.lint_expression(stmt.test, translate=False)
             if lr.is_valid and lr.ir:
                 inv_irs.append(lr.ir)
             else:
                 break
         return inv_irs
+
+
+# Exact ast node class -> translation method.  The parser only produces
+# these concrete classes, so one dict lookup on type() replaces the
+# isinstance cascade that used to run for every expression node.
+_EXPR_TRANSLATIONS = {
+    ast.Name: PyIRTranslator._translate_name,
+    ast.Constant: PyIRTranslator._translate_constant,
+    ast.BinOp: PyIRTranslator._translate_binop,
+    ast.Compare: PyIRTranslator._translate_compare,
+    ast.BoolOp: PyIRTranslator._translate_boolop,
+    ast.UnaryOp: PyIRTranslator._translate_unaryop,
+    ast.Call: PyIRTranslator._translate_call,
+    ast.Subscript: PyIRTranslator._translate_subscript,
+    ast.Attribute: PyIRTranslator._translate_attribute,
+    ast.List: lambda self, n: PyListLiteral(elements=self._translate_elements(n)),
+    ast.Dict: PyIRTranslator._translate_dict,
+    ast.Set: lambda self, n: PySetLiteral(elements=self._translate_elements(n)),
+    ast.Tuple: lambda self, n: PyTupleLiteral(elements=self._translate_elements(n)),
+    ast.ListComp: PyIRTranslator._translate_list_comp,
+    ast.GeneratorExp: PyIRTranslator._translate_generator,
+}
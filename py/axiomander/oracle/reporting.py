@@ -28,6 +28,10 @@ class ProofLevel(Enum):
     COUNTEREXAMPLE     = "counterexample"  # SMT found a model showing the property is false
 
 
+# Levels that mean no tier closed the goal.
+_NOT_PROVED_LEVELS = frozenset({ProofLevel.UNPROVED, ProofLevel.COUNTEREXAMPLE})
+
+
 class GoalOutcome(str, Enum):
     """Dafny-flavored outcome for a verification goal.
 
@@ -99,7 +103,7 @@ class GoalStatus:
                         and self.level != ProofLevel.COUNTEREXAMPLE,
                         result == True)
         """
-        return self.level not in (ProofLevel.UNPROVED, ProofLevel.COUNTEREXAMPLE)
+        return self.level not in _NOT_PROVED_LEVELS
 
     def to_dict(self) -> dict:
         """Serialize to the canonical Dafny-flavored JSON schema dict.
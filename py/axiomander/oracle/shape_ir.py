@@ -51,6 +51,29 @@ def _escape_field(name: str) -> str:
 
 _shape_registry: dict[str, Shape] = {}
 _enum_registry: dict[str, dict[str, int]] = {}  # e.g. ProofLevel → {"UNPROVED": 0, ...}
+# Imported-module trees keyed by path, tagged with (mtime_ns, size); None for
+# a file that did not parse.  The registry is rebuilt once per function, so
+# without this every imported module was re-read and re-parsed each time.
+_imported_module_trees: dict[str, tuple[tuple[int, int], Optional[ast.Module]]] = {}
+
+
+def _parse_imported_module(path: str) -> Optional[ast.Module]:
+    """Parse [path], reusing the cached tree while the file is unchanged.
+
+    Raises OSError if the file cannot be stat'ed or read."""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _imported_module_trees.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path) as f:
+        text = f.read()
+    try:
+        mod_tree: Optional[ast.Module] = ast.parse(text)
+    except SyntaxError:
+        mod_tree = None
+    _imported_module_trees[path] = (stamp, mod_tree)
+    return mod_tree
 
 
 def build_shape_registry(tree: ast.Module, _cwd: str = ".") -> dict[str, Shape]:
@@ -84,13 +107,14 @@ def build_shape_registry(tree: ast.Module, _cwd: str = ".") -> dict[str, Shape]:
             alt_path = os.path.join(_cwd, f"{module.replace('.', '/')}.py")
             for path in (import_path, alt_path):
                 try:
-                    with open(path) as f:
-                        mod_tree = ast.parse(f.read())
-                    _scan(mod_tree)
-                    _visited.add(module)
-                    break
-                except (OSError, SyntaxError):
+                    mod_tree = _parse_imported_module(path)
+                except OSError:
                     continue
+                if mod_tree is None:
+                    continue
+                _scan(mod_tree)
+                _visited.add(module)
+                break
 
     return _shape_registry
 
@@ -24,7 +24,7 @@ from __future__ import annotations
 import ast
 from dataclasses import dataclass, field
 
-from axiomander.oracle.predicate_def import PredicateDef, RecKind
+from axiomander.oracle.predicate_def import PredicateDef, RecKind, _is_recursive_expr
 
 
 @dataclass(frozen=True)
@@ -198,15 +198,7 @@ def _extract_base_case(pd: PredicateDef) -> str:
 
 def _is_nonrecursive(node: ast.AST, name: str) -> bool:
     """Check if an AST subtree contains no self-calls to *name*."""
-    class Checker(ast.NodeVisitor):
-        has_call = False
-        def visit_Call(self, node):
-            if isinstance(node.func, ast.Name) and node.func.id == name:
-                self.has_call = True
-            self.generic_visit(node)
-    c = Checker()
-    c.visit(node)
-    return not c.has_call
+    return not _is_recursive_expr(node, name)
 
 
 def _emit_structural_stub(name: str, param: str) -> str:
@@ -9,6 +9,7 @@ If UNSAT, the VCG is valid (proved). If SAT, there's a counterexample.
 """
 
 import re
+import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass, field
@@ -26,6 +27,23 @@ class SmtResult:
     error: str = ""
 
 
+# Solvers found on PATH, remembered so each query skips the PATH scan.  Misses
+# are not remembered: a solver installed while a server runs is picked up on
+# the next lookup.
+_ON_PATH: set[str] = set()
+
+
+def _find_solver(preference: tuple[str, ...] = ("cvc4", "z3", "cvc5")) -> str | None:
+    """Return the first solver in [preference] found on PATH, or None."""
+    for name in preference:
+        if name in _ON_PATH:
+            return name
+        if shutil.which(name) is not None:
+            _ON_PATH.add(name)
+            return name
+    return None
+
+
 def verify_inv_update(
     inv_old: str,
     body_equalities: list[tuple[str, str]],
@@ -85,7 +103,7 @@ def verify_inv_update(
 
         for s in ([solver] if solver != "any"
                   else ["cvc4", "z3", "cvc5"]):
-            if not __import__("shutil").which(s):
+            if not _find_solver((s,)):
                 continue
             try:
                 result = subprocess.run(
@@ -171,6 +189,16 @@ def verify_vcg(
             tmp_path.unlink(missing_ok=True)
 
 
+_EXTRACT_VARS_EXCLUDED = frozenset({
+    'true', 'false', 'z', 'string', 'and', 'or', 'not',
+    'fun', 's', 'leb', 'parray_key', 'prop',
+    'forall', 'exists', 'int', 'ite', 'mod', 'div', 'abs'})
+
+# Maximal runs of identifier characters; the scan runs in the C regex
+# engine instead of a per-character Python loop.
+_WORD_RUN_RE = re.compile(r'\w+')
+
+
 def _extract_vars(*args: str) -> set[str]:
     """Extract variable-name identifiers from Coq expressions.
 
@@ -178,25 +206,14 @@ def _extract_vars(*args: str) -> set[str]:
       post: vars_set contains all substrings matching [a-zA-Z_][a-zA-Z0-9_]*
             from all args, minus the excluded keyword set.
     """
-    EXCLUDED = {'true', 'false', 'z', 'string', 'and', 'or', 'not',
-                'fun', 's', 'leb', 'parray_key', 'prop',
-                'forall', 'exists', 'int', 'ite', 'mod', 'div', 'abs'}
     vars_set = set()
     for expr in args:
         if not expr:
             continue
-        current = ""
-        for c in expr:
-            if c.isalnum() or c == '_':
-                current += c
-            else:
-                if current and (current[0].isalpha() or current[0] == '_'):
-                    if current.lower() not in EXCLUDED:
-                        vars_set.add(current)
-                current = ""
-        if current and (current[0].isalpha() or current[0] == '_'):
-            if current.lower() not in EXCLUDED:
-                vars_set.add(current)
+        for current in _WORD_RUN_RE.findall(expr):
+            if current[0].isalpha() or current[0] == '_':
+                if current.lower() not in _EXTRACT_VARS_EXCLUDED:
+                    vars_set.add(current)
     return vars_set
 
 
@@ -344,26 +361,37 @@ def _balanced(expr: str) -> bool:
     return depth == 0
 
 
+# One integer assignment in a (get-model) response.  cvc4 prints negative
+# values as (- 5); z3 may break the definition across lines.
+_MODEL_INT_RE = re.compile(
+    r'\(define-fun\s+(\w+)\s+\(\)\s+Int\s+(-?\d+|\(-\s*\d+\))\s*\)')
+
+
+def _parse_smt_model(output: str) -> dict[str, int]:
+    """Integer variable assignments from a solver's (get-model) output."""
+    model: dict[str, int] = {}
+    for m in _MODEL_INT_RE.finditer(output):
+        val = m.group(2)
+        model[m.group(1)] = -int(val[2:-1]) if val[0] == '(' else int(val)
+    return model
+
+
 def _parse_smt_output(output: str, solver: str) -> SmtResult:
     """Parse SMT solver output."""
-    lines = output.strip().split('\n')
     status = ""
-    model: dict[str, int] = {}
-
-    for line in lines:
+    for line in output.strip().split('\n'):
         line = line.strip()
         if line == 'sat':
             status = 'sat'
-        elif line == 'unsat':
+            break
+        if line == 'unsat':
             status = 'unsat'
-        elif line.startswith('(define-fun') and status == 'sat':
-            m = re.match(r'\(define-fun\s+(\w+)\s+\(\)\s+Int\s+(-?\d+)\)', line)
-            if m:
-                model[m.group(1)] = int(m.group(2))
+            break
 
     if status == 'unsat':
         return SmtResult(is_valid=True, solver=solver, raw_output=output)
     elif status == 'sat':
+        model = _parse_smt_model(output)
         return SmtResult(
             is_valid=False, counterexample=model,
             solver=solver, raw_output=output,
@@ -12,8 +12,10 @@ from typing import Optional, Literal
 
 
 # ── Expressions ──────────────────────────────────────────────────
+# Expression nodes use slots: lowered bodies hold many of them and none
+# carry attributes beyond their declared fields.
 
-@dataclass
+@dataclass(slots=True)
 class SLet:
     """Let-binding: let x = e1 in e2.  Iris: wp_let / wp_bind."""
     var: str
@@ -25,7 +27,29 @@ class SLet:
         return f'(Let "{self.var}" {self.value.to_coq()} {self.body.to_coq()})'
 
 
-@dataclass
+# SnakeletIR binop name -> heapLang operator constructor.  Module-level so
+# rendering a binop does not rebuild the table on every call.
+_BINOP_COQ = {
+    "add": "AddOp", "sub": "SubOp", "mul": "MulOp", "div": "DivOp",
+    "eq": "EqOp", "le": "LeOp", "lt": "LtOp", "gt": "GtOp", "ge": "GeOp",
+    "ne": "NeOp", "mod": "ModOp", "and": "AndOp", "or": "OrOp",
+    "len": "LenOp", "in": "InOp", "union": "UnionOp", "inter": "InterOp",
+    "append": "AppendOp", "length": "LengthOp",
+    "dict_get": "DictGetOp", "mk_key_err": "MkKeyErrOp",
+    "dict_get_int": "DictGetIntOp",
+    "set_add": "SetAddOp",
+    "str_index": "StrIndexOp",
+    "starts_with": "StartsWithOp",
+    "ends_with": "EndsWithOp",
+    "to_lower": "ToLowerOp",
+    "to_upper": "ToUpperOp",
+    "dict_set": "DictSetOp",
+    "tuple": "TupleOp",
+    "str_contains": "StrContainsOp",
+}
+
+
+@dataclass(slots=True)
 class SBinOp:
     """Binary operation.  Iris: wp_binop."""
     op: str          # "add" | "sub" | "mul" | "div" | "eq" | "lt" | "gt"
@@ -34,28 +58,11 @@ class SBinOp:
     kind: Literal["binop"] = "binop"
 
     def to_coq(self) -> str:
-        op_map = {"add": "AddOp", "sub": "SubOp", "mul": "MulOp",
-                  "div": "DivOp",
-                  "eq": "EqOp", "le": "LeOp", "lt": "LtOp", "gt": "GtOp", "ge": "GeOp",
-                  "ne": "NeOp", "mod": "ModOp", "and": "AndOp", "or": "OrOp",
-                  "len": "LenOp", "in": "InOp", "union": "UnionOp", "inter": "InterOp",
-                  "append": "AppendOp", "length": "LengthOp",
-                  "dict_get": "DictGetOp", "mk_key_err": "MkKeyErrOp",
-                  "dict_get_int": "DictGetIntOp",
-                  "set_add": "SetAddOp",
-                   "str_index": "StrIndexOp",
-                   "starts_with": "StartsWithOp",
-                   "ends_with": "EndsWithOp",
-                    "to_lower": "ToLowerOp",
-                    "to_upper": "ToUpperOp",
-                    "dict_set": "DictSetOp",
-                    "tuple": "TupleOp",
-                    "str_contains": "StrContainsOp"}
-        coq_op = op_map.get(self.op, "AddOp")
+        coq_op = _BINOP_COQ.get(self.op, "AddOp")
         return f"(BinOp {coq_op} {self.left.to_coq()} {self.right.to_coq()})"
 
 
-@dataclass
+@dataclass(slots=True)
 class SLoad:
     """Heap load.  Iris: wp_load."""
     loc: str         # variable name holding the location
@@ -65,7 +72,7 @@ class SLoad:
         return f'(Load (Var "{self.loc}"))'
 
 
-@dataclass
+@dataclass(slots=True)
 class SStore:
     """Heap store.  Iris: wp_store."""
     loc: str         # variable name holding the location
@@ -76,7 +83,7 @@ class SStore:
         return f'(Store (Var "{self.loc}") {self.value.to_coq()})'
 
 
-@dataclass
+@dataclass(slots=True)
 class SAlloc:
     """Heap allocation.  Iris: wp_alloc."""
     value: "SExpr"
@@ -86,7 +93,7 @@ class SAlloc:
         return f'(Alloc {self.value.to_coq()})'
 
 
-@dataclass
+@dataclass(slots=True)
 class SIf:
     """Conditional.  Iris: wp_if."""
     cond: "SExpr"
@@ -99,7 +106,7 @@ class SIf:
                 f" {self.else_branch.to_coq()})")
 
 
-@dataclass
+@dataclass(slots=True)
 class SReturn:
     """Return value.  Iris: postcondition (RET val)."""
     value: "SExpr"
@@ -109,7 +116,7 @@ class SReturn:
         return self.value.to_coq()
 
 
-@dataclass
+@dataclass(slots=True)
 class SWhile:
     """While loop.  Iris: wp_while + loop_unfold stage tactic.
     The loop value is always LitUnit; results flow through heap cells."""
@@ -122,7 +129,7 @@ class SWhile:
         return f"(While {self.cond.to_coq()} {self.body.to_coq()})"
 
 
-@dataclass
+@dataclass(slots=True)
 class SFor:
     """For-each loop over a list value."""
     var: str
@@ -136,7 +143,17 @@ class SFor:
         return f'(For "{self.var}" {self.lst.to_coq()} {self.body.to_coq()})'
 
 
-@dataclass
+# Scalar literal type -> heapLang value template, filled with ``SLit.value``.
+# One dict lookup replaces the per-type if-chain in SLit rendering.
+_SCALAR_LIT_COQ = {
+    "float": "(LitFloat {}%float)",
+    "float_param": "(LitFloat (z2float {}))",
+    "string": '(LitString "{}")',
+    "exn": '(LitExn "{}" LitUnit)',
+}
+
+
+@dataclass(slots=True)
 class SLit:
     """Literal.  Iris: LitV (LitInt n) / LitV (LitLoc l)."""
     lit_type: str    # "int" | "bool" | "float" | "string" | "tuple" | "list" | "dict" | "set" | "loc" | "unit"
@@ -154,10 +171,9 @@ class SLit:
                 return f"(LitInt ({v}))"
             return f"(LitInt {self.value})"
         if self.lit_type == "bool": return f"(LitBool {'true' if self.value.lower() == 'true' else 'false'})"
-        if self.lit_type == "float": return f"(LitFloat {self.value}%float)"
-        if self.lit_type == "float_param": return f"(LitFloat (z2float {self.value}))"
-        if self.lit_type == "string": return f'(LitString "{self.value}")'
-        if self.lit_type == "exn": return f'(LitExn "{self.value}" LitUnit)'
+        fmt = _SCALAR_LIT_COQ.get(self.lit_type)
+        if fmt is not None:
+            return fmt.format(self.value)
         if self.lit_type == "unit": return "LitUnit"
         if self.lit_type in ("tuple", "list", "set"):
             tag = f"Lit{self.lit_type.capitalize()}"
@@ -185,15 +201,13 @@ class SLit:
             return f"(Val {self.to_coq_val()})"
         if self.lit_type == "int": return f"(Val (LitInt {self.value}))"
         if self.lit_type == "bool": return f"(Val (LitBool {'true' if self.value.lower() == 'true' else 'false'}))"
-        if self.lit_type == "float": return f"(Val (LitFloat {self.value}%float))"
-        if self.lit_type == "float_param": return f"(Val (LitFloat (z2float {self.value})))"
-        if self.lit_type == "string": return f'(Val (LitString "{self.value}"))'
-        if self.lit_type == "exn": return f'(Val (LitExn "{self.value}" LitUnit))'
-        if self.lit_type == "unit": return "(Val LitUnit)"
+        fmt = _SCALAR_LIT_COQ.get(self.lit_type)
+        if fmt is not None:
+            return "(Val " + fmt.format(self.value) + ")"
         return "(Val LitUnit)"
 
 
-@dataclass
+@dataclass(slots=True)
 class SVar:
     """Variable reference.  Iris: bound variable (wp_let naming)."""
     name: str
@@ -203,7 +217,7 @@ class SVar:
         return f'(Var "{self.name}")'
 
 
-@dataclass
+@dataclass(slots=True)
 class SApp:
     """Function application.  Iris: wp_call / wp_call_unfold."""
     func: str
@@ -217,7 +231,7 @@ class SApp:
         return f'(Call "{self.func}" ({items} :: nil))'
 
 
-@dataclass
+@dataclass(slots=True)
 class SSeq:
     """Sequence of expressions.  Iris: let _ = e1 in e2."""
     exprs: list["SExpr"]
@@ -233,7 +247,7 @@ class SSeq:
         return f'(Let "_" {head.to_coq()} {rest.to_coq()})'
 
 
-@dataclass
+@dataclass(slots=True)
 class SFork:
     """Fork a thread.  Iris: wp_fork."""
     expr: "SExpr"
@@ -243,7 +257,7 @@ class SFork:
         raise NotImplementedError("SFork lowering to SnakeletLang: phase 3")
 
 
-@dataclass
+@dataclass(slots=True)
 class SFAA:
     """Fetch-and-add: atomic x += v.  Iris: wp_faa."""
     loc: str
@@ -254,7 +268,7 @@ class SFAA:
         raise NotImplementedError("SFAA lowering to SnakeletLang: phase 3")
 
 
-@dataclass
+@dataclass(slots=True)
 class SRaise:
     """Raise exception.  Encoded as ORaise outcome in WP."""
     exc: SExpr
@@ -264,7 +278,7 @@ class SRaise:
         return f'(Raise {self.exc.to_coq()})'
 
 
-@dataclass
+@dataclass(slots=True)
 class STry:
     """Try/except.  Encoded as ORaise match in WP."""
     body: SExpr
@@ -278,7 +292,7 @@ class STry:
         return f'(Try {self.body.to_coq()} "{self.exc_var}" {self.handler.to_coq()})'
 
 
-@dataclass
+@dataclass(slots=True)
 class SDictGet:
     """Dict lookup: d[key] → gmap lookup.  Pure, no heap mutation."""
     loc: str
@@ -289,7 +303,7 @@ class SDictGet:
         return f'(DictGet (Var "{self.loc}") {self.key.to_coq()})'
 
 
-@dataclass
+@dataclass(slots=True)
 class SDictSet:
     """Dict set: d[key] = val → gmap insert.  Pure, no heap mutation."""
     loc: str
@@ -301,7 +315,7 @@ class SDictSet:
         return f'(DictSet (Var "{self.loc}") {self.key.to_coq()} {self.value.to_coq()})'
 
 
-@dataclass
+@dataclass(slots=True)
 class SCompound:
     """Build a compound value (tuple/list/set/dict) from expressions.
 
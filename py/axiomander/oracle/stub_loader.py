@@ -91,20 +91,22 @@ def _parse_py_expression_to_coq(expr_str: str, params: list[str], is_post: bool
 
 
 def _manual_scope(expr_str: str, params: list[str], is_post: bool = False) -> str:
-    """Fallback: manually scope variables in a Coq expression."""
-    import re
-    result = expr_str
-    for p in params:
-        result = re.sub(
-            rf'(?<![a-zA-Z0-9_"%]){re.escape(p)}(?![a-zA-Z0-9_"%])',
-            f's "{p}"%string', result
-        )
+    """Fallback: manually scope variables in a Coq expression.
+
+    All names are rewritten in one scan, so the ``s "..."%string`` text
+    inserted for one name is never rescanned for another.
+    """
+    names = list(params)
     if is_post:
-        result = re.sub(
-            r'(?<![a-zA-Z0-9_"%])result(?![a-zA-Z0-9_"%])',
-            's "result"%string', result
-        )
-    return result
+        names.append("result")
+    if not names:
+        return expr_str
+    name_re = re.compile(
+        r'(?<![a-zA-Z0-9_"%])('
+        + "|".join(re.escape(n) for n in names)
+        + r')(?![a-zA-Z0-9_"%])'
+    )
+    return name_re.sub(lambda m: f's "{m.group(1)}"%string', expr_str)
 
 
 class StubLoader:
@@ -148,7 +150,11 @@ class StubLoader:
         self._load_all()
 
     def _load_all(self) -> None:
-        """Load all .pyi files from search directories."""
+        """Load all .pyi files from search directories.
+
+        Files are read one after another; a thread pool costs more to
+        start than reading local stubs takes.
+        """
         for stub_dir in self._search_dirs:
             for pyi_file in stub_dir.glob("*.pyi"):
                 self._load_file(pyi_file)
@@ -157,7 +163,8 @@ class StubLoader:
         """Load contracts from a single .pyi file."""
         try:
             tree = ast.parse(path.read_text())
-        except SyntaxError:
+        except (SyntaxError, OSError):
+            # Malformed, vanished or unreadable: skip it rather than abort.
             return
 
         for node in ast.iter_child_nodes(tree):
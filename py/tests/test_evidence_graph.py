@@ -0,0 +1,97 @@
+"""Tests for the evidence graph (caller/callee traversal, cycles, staleness)."""
+
+import pytest
+
+from axiomander.oracle.evidence_graph import (
+    ContractEdge,
+    ContractNode,
+    ContractSpec,
+    Evidence,
+    EvidenceGraph,
+    EvidenceKind,
+    ProofStatus,
+)
+
+
+def _node(name: str, *callees: str) -> ContractNode:
+    return ContractNode(
+        spec=ContractSpec(name=name),
+        edges=[ContractEdge(callee_name=c, callee_spec=ContractSpec(name=c))
+               for c in callees],
+    )
+
+
+def _graph(*nodes: ContractNode) -> EvidenceGraph:
+    g = EvidenceGraph()
+    for n in nodes:
+        g.add_node(n)
+    return g
+
+
+# ---------------------------------------------------------------------------
+# Caller queries
+# ---------------------------------------------------------------------------
+
+def test_callers_index_matches_get_callers():
+    g = _graph(_node("leaf"), _node("mid", "leaf", "leaf"),
+               _node("top", "mid", "leaf"))
+    index = g.callers_index()
+    for name in g.nodes:
+        assert list(index.get(name, ())) == g.get_callers(name)
+
+
+def test_transitive_callers_diamond():
+    g = _graph(_node("leaf"), _node("a", "leaf"), _node("b", "leaf"),
+               _node("top", "a", "b"))
+    assert sorted(g.get_transitive_callers("leaf")) == ["a", "b", "top"]
+    assert g.get_transitive_callers("top") == []
+
+
+def test_transitive_callers_in_discovery_order():
+    g = _graph(_node("leaf"), _node("mid", "leaf"), _node("top", "mid"))
+    assert g.get_transitive_callers("leaf") == ["mid", "top"]
+
+
+# ---------------------------------------------------------------------------
+# Cycle detection
+# ---------------------------------------------------------------------------
+
+def test_cycle_detected_through_chain_deeper_than_recursion_limit():
+    depth = 5000
+    g = _graph(*(_node(f"f{i}", f"f{i + 1}") for i in range(depth)),
+               _node(f"f{depth}", "top"))
+    with pytest.raises(ValueError, match="Cycle"):
+        g.add_node(_node("top", "f0"))
+
+
+def test_cycle_detected_through_later_edge_sharing_explored_nodes():
+    # "shared" is explored via the first edge and must not hide the cycle
+    # reachable only through the second.
+    g = _graph(_node("shared"), _node("a", "shared"),
+               _node("b", "shared", "top"))
+    with pytest.raises(ValueError, match=r"Cycle: top → \.\.\. → b → top"):
+        g.add_node(_node("top", "a", "b"))
+
+
+def test_transitive_callers_of_several_roots_is_union():
+    g = _graph(_node("leaf1"), _node("leaf2"), _node("a", "leaf1"),
+               _node("b", "leaf2", "a"), _node("top", "b"))
+    union = set(g.get_transitive_callers("leaf1")) | set(
+        g.get_transitive_callers("leaf2"))
+    assert sorted(g.transitive_callers_of(["leaf1", "leaf2"])) == sorted(union)
+
+
+# ---------------------------------------------------------------------------
+# Staleness
+# ---------------------------------------------------------------------------
+
+def test_mark_stale_marks_transitive_callers_only():
+    g = _graph(_node("leaf"), _node("mid", "leaf"), _node("top", "mid"),
+               _node("other"))
+    for n in g.nodes.values():
+        n.evidence.append(Evidence(kind=EvidenceKind.LTAC,
+                                   status=ProofStatus.PROVED_L1_LTAC))
+    assert g.mark_stale("leaf") == {"mid", "top"}
+    stale = {name for name, n in g.nodes.items()
+             if n.evidence[0].status is ProofStatus.STALE}
+    assert stale == {"mid", "top"}
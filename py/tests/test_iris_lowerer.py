@@ -0,0 +1,29 @@
+"""PyIR -> SnakeletIR lowering of individual expressions (no coqc needed)."""
+
+from axiomander.oracle.iris_lowerer import IrisLowerer
+from axiomander.oracle.py_ir import PyCompare, PyConstant, PyName
+from axiomander.oracle.snakelet_ir import SBinOp, SLit, SVar
+
+NONE = PyConstant(value=None, py_type="None")
+UNIT = SLit(lit_type="unit", value="()")
+
+
+def lower(expr):
+    return IrisLowerer({}).lower_expr(expr)
+
+
+def test_none_lowers_to_unit():
+    lowered = lower(NONE)
+    assert lowered == UNIT
+    assert lowered.to_coq() == "(Val LitUnit)"
+
+
+def test_is_none_compares_against_unit():
+    lowered = lower(PyCompare(op="is", left=PyName(name="x"), right=NONE))
+    assert lowered == SBinOp(op="eq", left=SVar(name="x"), right=UNIT)
+    assert lowered.to_coq() == '(BinOp EqOp (Var "x") (Val LitUnit))'
+
+
+def test_is_not_none_compares_against_unit():
+    lowered = lower(PyCompare(op="is not", left=PyName(name="x"), right=NONE))
+    assert lowered == SBinOp(op="ne", left=SVar(name="x"), right=UNIT)
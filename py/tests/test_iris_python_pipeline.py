@@ -8,7 +8,9 @@ must FAIL (wrong post, missing pre).
 """
 
 import os
+import shutil
 import subprocess
+import time
 import tempfile
 from pathlib import Path
 
@@ -1564,3 +1566,78 @@ def bin_search(xs: list[int], target: int) -> bool:
     return False
 ''', func_name='bin_search')
     assert ok, f"bin_search must verify: {out[:400]}"
+
+
+@pytest.mark.skipif(shutil.which("coqc") is None, reason="coqc not available")
+def test_run_iris_pipeline_jobs_matches_serial(tmp_path):
+    """jobs=2 verifies in a process pool but reports the same goals, in
+    source order, as the serial run."""
+    from axiomander.oracle.iris_pipeline import run_iris_pipeline
+    py_file = tmp_path / "batch.py"
+    py_file.write_text('''
+def inc(x: int) -> int:
+    assert x >= 0
+    r = x + 1
+    assert r >= 1
+    return r
+
+def dbl(x: int) -> int:
+    assert x >= 0
+    r = x + x
+    assert r >= x
+    return r
+
+def bad(x: int) -> int:
+    r = x - 1
+    assert r >= x
+    return r
+''')
+    serial = run_iris_pipeline(str(py_file), TABLE, quiet=True, jobs=1)
+    pooled = run_iris_pipeline(str(py_file), TABLE, quiet=True, jobs=2)
+
+    def summary(report):
+        return [(g.name, g.level, g.error_detail) for g in report.goals]
+
+    assert summary(pooled) == summary(serial)
+    assert [g.name for g in pooled.goals] == ["inc", "dbl", "bad"]
+    assert pooled.proved_goals == serial.proved_goals
+
+
+def _fake_verify_named(source, table, cwd, kwargs, name):
+    """Stand-in pool worker: distinct result per function, one crash."""
+    from axiomander.oracle.reporting import GoalStatus, ProofLevel
+    if name == "dbl":
+        raise RuntimeError("worker blew up")
+    if name == "inc":
+        time.sleep(0.3)   # finish last, so completion order != source order
+    return GoalStatus(name=name, goal_statement=f"post of {name}",
+                      level=(ProofLevel.LEVEL1_LTAC if name == "inc"
+                             else ProofLevel.UNPROVED),
+                      error_detail=None if name == "inc" else f"no {name}")
+
+
+def test_run_iris_pipeline_jobs_keeps_order_and_isolates_crash(
+        tmp_path, monkeypatch):
+    """Pooled results come back in source order, and a worker that raises
+    marks only its own function UNPROVED (no coqc needed)."""
+    from axiomander.oracle import iris_pipeline
+    from axiomander.oracle.reporting import ProofLevel
+    monkeypatch.setattr(iris_pipeline, "_verify_iris_named",
+                        _fake_verify_named)
+    py_file = tmp_path / "batch.py"
+    py_file.write_text(
+        "def inc(x): return x\n"
+        "def dbl(x): return x\n"
+        "def neg(x): return x\n")
+    report = iris_pipeline.run_iris_pipeline(
+        str(py_file), TABLE, quiet=True, jobs=2)
+
+    assert [g.name for g in report.goals] == ["inc", "dbl", "neg"]
+    inc, dbl, neg = report.goals
+    assert inc.level == ProofLevel.LEVEL1_LTAC
+    assert inc.goal_statement == "post of inc"
+    assert dbl.level == ProofLevel.UNPROVED
+    assert dbl.error_detail == "RuntimeError: worker blew up"
+    assert neg.level == ProofLevel.UNPROVED
+    assert neg.error_detail == "no neg"
+    assert report.proved_goals == 1
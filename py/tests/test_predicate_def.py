@@ -147,4 +147,20 @@ def test_predicate_def_frozen():
     pd = PredicateDef(name="f", params=["x"], body_expr=None,
                       rec_kind=RecKind.NONREC)
     with pytest.raises(Exception):
-        pd.name = "g"
\ No newline at end of file
+        pd.name = "g"
+
+# ---------------------------------------------------------------------------
+# Inlining at call sites (ContractLinter)
+# ---------------------------------------------------------------------------
+
+def test_inline_leaves_predicate_body_intact():
+    from axiomander.oracle.contract_linter import ContractLinter
+
+    body = ast.parse("n > 0 and n < 10", mode="eval").body
+    before = ast.dump(body)
+    linter = ContractLinter(["a", "b"], predicates={"small": (["n"], body)})
+    first = linter.lint_expression(ast.parse("small(a)", mode="eval").body)
+    second = linter.lint_expression(ast.parse("small(b)", mode="eval").body)
+    assert first.smt_translation == "(and (> a 0) (< a 10))"
+    assert second.smt_translation == "(and (> b 0) (< b 10))"
+    assert ast.dump(body) == before
@@ -355,6 +355,15 @@ class TestGenerateTests:
         output = generate_tests(SIMPLE_ADD)
         assert "Auto-generated property tests" in output
 
+    def test_repeated_function_name_emitted_once(self):
+        output = generate_tests(SIMPLE_ADD + "\n" + SIMPLE_ADD, module_path="demo.py")
+        assert "from demo import add\n" in output
+        assert output.count("def test_add_contracts(") == 1
+
+    def test_bytes_source_matches_str_source(self):
+        output = generate_tests(SIMPLE_ADD.encode("utf-8"))
+        assert output == generate_tests(SIMPLE_ADD)
+
 
 # ---------------------------------------------------------------------------
 # counterexample_to_test
@@ -329,6 +329,27 @@ class Order(BaseModel):
     assert isinstance(price_val, VInt) and price_val.v == order.price == 99
 
 
+def test_shape_registry_rereads_changed_imported_module(tmp_path):
+    """Imported-module trees are reused only while the file is unchanged."""
+    import ast
+    import os
+    from axiomander.oracle.shape_ir import build_shape_registry, lookup_enum_value
+
+    mod = tmp_path / "colours.py"
+    mod.write_text("from enum import IntEnum\nclass Colour(IntEnum):\n    RED = 1\n")
+    tree = ast.parse("from colours import Colour\n")
+
+    build_shape_registry(tree, str(tmp_path))
+    assert lookup_enum_value("Colour", "RED") is not None
+    assert lookup_enum_value("Colour", "BLUE") is None
+
+    mod.write_text("from enum import IntEnum\nclass Colour(IntEnum):\n    RED = 1\n    BLUE = 2\n")
+    st = os.stat(mod)
+    os.utime(mod, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    build_shape_registry(tree, str(tmp_path))
+    assert lookup_enum_value("Colour", "BLUE") is not None
+
+
 # -- String substring containment (str_contains) --------------------------
 
 def test_str_contains_found():